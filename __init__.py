@@ -2,17 +2,25 @@ from typing_extensions import override
 
 from comfy_api.latest import ComfyExtension, io
 
+from .nodes.resolution.image_dimension_probe import ImageDimensionProbe
 from .nodes.resolution.image_dimension_resizer import ImageDimensionResizer
 from .nodes.resolution.image_sizer import ImageSizer
 from .nodes.resolution.image_sizer_all import ImageSizerAll
 from .nodes.resolution.random_ratio import RandomRatio
+from .nodes.resolution.random_ratio_sizer import RandomRatioSizer
 from .nodes.prompt_selection.seed_based_output_selector import SeedBasedOutputSelector
-from .nodes.prompt_wildcards.simple_wildcard_picker import SimpleWildcardPicker
+from .nodes.prompt_wildcards.simple_wildcard_picker import (
+    SimpleWildcardPicker,
+    SimpleWildcardPickerBatch,
+    WildcardEnumerator,
+)
 from .nodes.prompt_tags.tag_injector import TagInjector, TagInjectorSingle, TagInjectorDuo
 from .nodes.prompt_tags.tag_injector_large import TagInjectorLarge
-from .nodes.random_seed.next_seed import NextSeed
+from .nodes.prompt_tags.tag_injector_dynamic import TagInjectorDynamic, TagMapBuilder
+from .nodes.random_seed.next_seed import NextSeed, NextSeedSequence
 from .nodes.random_numbers.random_float import RandomFloat
 from .nodes.random_numbers.random_int import RandomInt
+from .nodes.random_numbers.random_batch import RandomFloatBatch, RandomIntBatch
 
 NODE_CLASS_MAPPINGS = {}
 
@@ -25,18 +33,27 @@ class GR85Extension(ComfyExtension):
         print("[comfyui_gr85] GR85Extension.get_node_list called")
         return [
             SimpleWildcardPicker,
+            SimpleWildcardPickerBatch,
+            WildcardEnumerator,
             SeedBasedOutputSelector,
             TagInjectorSingle,
             TagInjectorDuo,
             TagInjector,
             TagInjectorLarge,
+            TagInjectorDynamic,
+            TagMapBuilder,
             RandomFloat,
             RandomInt,
+            RandomFloatBatch,
+            RandomIntBatch,
             NextSeed,
+            NextSeedSequence,
+            ImageDimensionProbe,
             ImageDimensionResizer,
             ImageSizerAll,
             ImageSizer,
             RandomRatio,
+            RandomRatioSizer,
         ]
 
 
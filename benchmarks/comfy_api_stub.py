@@ -0,0 +1,70 @@
+"""Minimal stand-in for `comfy_api.latest`, so node modules import outside ComfyUI.
+
+Only what the GR85 node modules touch at import and execute time is provided:
+schema objects record their arguments, and `io.NodeOutput` keeps its values in
+`.args`. Nothing here validates inputs the way ComfyUI does.
+"""
+import sys
+import types
+
+
+class _Port:
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+
+
+class _IOType:
+    Input = _Port
+    Output = _Port
+
+
+class Schema:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class NodeOutput:
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+
+
+class ComfyNode:
+    pass
+
+
+class ComfyExtension:
+    async def get_node_list(self):
+        return []
+
+
+class _IOModule(types.ModuleType):
+    ComfyNode = ComfyNode
+    Schema = Schema
+    NodeOutput = NodeOutput
+
+    def __getattr__(self, name):
+        # io.String, io.Int, io.Combo, io.Image, ...: every data type looks the same here.
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _IOType
+
+
+def install() -> bool:
+    """Register the stand-in unless the real `comfy_api` is importable; True if installed."""
+    try:
+        import comfy_api.latest  # noqa: F401
+        return False
+    except ImportError:
+        pass
+
+    comfy_api = types.ModuleType("comfy_api")
+    latest = types.ModuleType("comfy_api.latest")
+    latest.io = _IOModule("comfy_api.latest.io")
+    latest.ComfyExtension = ComfyExtension
+    comfy_api.latest = latest
+    sys.modules["comfy_api"] = comfy_api
+    sys.modules["comfy_api.latest"] = latest
+    sys.modules["comfy_api.latest.io"] = latest.io
+    return True
@@ -0,0 +1,162 @@
+"""Concurrency stress harness for the GR85 random nodes.
+
+Runs without ComfyUI, using the stand-in in `comfy_api_stub.py`:
+
+    python benchmarks/random_stress.py [--calls 20000] [--threads 16] [--processes 4] [--quick]
+
+Every node under `nodes/random_numbers` and `nodes/random_seed`, RandomRatio and
+RandomRatioSizer is executed over a mix of seeds, ranges and generator modes: once
+serially as the reference, then from a thread pool (with an extra thread hammering the global
+`random` module, as another extension would) and from a process pool. Any output
+that differs from the serial run is reported, as is any change the nodes make to
+the interpreter-global `random` state.
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(_HERE))
+sys.path.insert(0, _HERE)
+
+from comfy_api_stub import install  # noqa: E402
+
+install()
+
+from nodes.random_numbers.counter_rng import RNG_MODES  # noqa: E402
+from nodes.random_numbers.low_discrepancy import SAMPLING_MODES  # noqa: E402
+from nodes.random_numbers.random_batch import RandomFloatBatch, RandomIntBatch  # noqa: E402
+from nodes.random_numbers.random_float import RandomFloat  # noqa: E402
+from nodes.random_numbers.random_int import RandomInt  # noqa: E402
+from nodes.random_seed.next_seed import NextSeed, NextSeedSequence  # noqa: E402
+from nodes.resolution.random_ratio import RandomRatio  # noqa: E402
+from nodes.resolution.random_ratio_sizer import DISTRIBUTIONS, RandomRatioSizer  # noqa: E402
+
+NODES = {
+    "RandomInt": RandomInt,
+    "RandomFloat": RandomFloat,
+    "RandomIntBatch": RandomIntBatch,
+    "RandomFloatBatch": RandomFloatBatch,
+    "NextSeed": NextSeed,
+    "NextSeedSequence": NextSeedSequence,
+    "RandomRatio": RandomRatio,
+    "RandomRatioSizer": RandomRatioSizer,
+}
+
+
+def make_cases(calls: int, seed: int = 0) -> list:
+    """`calls` node invocations as `(node name, kwargs)`, cycling through every node and mode."""
+    picker = random.Random(seed)
+    cases = []
+    while len(cases) < calls:
+        node_seed = picker.randrange(1 << 64)
+        low = picker.randint(-1000, 1000)
+        high = low + picker.randint(0, 10 ** picker.randint(0, 9))
+        dimension = picker.randrange(8)
+        for rng in SAMPLING_MODES:
+            cases.append(("RandomInt", dict(seed=node_seed, min_value=low, max_value=high, rng=rng,
+                                            dimension=dimension)))
+            cases.append(("RandomFloat", dict(seed=node_seed, min_value=float(low), max_value=float(high),
+                                              decimal_places=picker.randint(0, 10), rng=rng,
+                                              dimension=dimension)))
+            cases.append(("RandomRatio", dict(seed=node_seed, first_width=picker.randint(1, 21),
+                                              first_height=picker.randint(1, 21), second_width=picker.randint(1, 21),
+                                              second_height=picker.randint(1, 21), rng=rng, dimension=dimension)))
+            cases.append(("RandomRatioSizer", dict(seed=node_seed, first_width=picker.randint(1, 21),
+                                                   first_height=picker.randint(1, 21), second_width=picker.randint(1, 21),
+                                                   second_height=picker.randint(1, 21),
+                                                   pixel_amount=picker.choice((512 * 512, 1024 * 1024)),
+                                                   tolerance=picker.choice((8, 16, 64)),
+                                                   distribution=picker.choice(DISTRIBUTIONS), rng=rng,
+                                                   dimension=dimension)))
+        for rng in RNG_MODES:
+            cases.append(("NextSeed", dict(seed=node_seed, rng=rng, steps=picker.randint(1, 4))))
+            cases.append(("NextSeedSequence", dict(seed=node_seed, count=picker.randint(1, 8), rng=rng)))
+        cases.append(("RandomIntBatch", dict(seed=node_seed, count=8, min_value=low, max_value=high)))
+        cases.append(("RandomFloatBatch", dict(seed=node_seed, count=8, min_value=float(low),
+                                               max_value=float(high), decimal_places=6)))
+    return cases[:calls]
+
+
+def run_case(case: tuple) -> tuple:
+    name, kwargs = case
+    return NODES[name].execute(**kwargs).args
+
+
+def run_chunk(cases: list) -> list:
+    return [run_case(case) for case in cases]
+
+
+def _chunks(cases: list, size: int) -> list:
+    return [cases[i:i + size] for i in range(0, len(cases), size)]
+
+
+def _interfere(stop: threading.Event) -> None:
+    # Another extension reseeding and drawing from the global generator the whole time.
+    while not stop.is_set():
+        random.seed(time.perf_counter_ns())
+        random.random()
+
+
+def compare(label: str, cases: list, expected: list, actual: list, elapsed: float) -> int:
+    mismatches = [i for i, (want, got) in enumerate(zip(expected, actual)) if want != got]
+    status = "ok" if not mismatches else f"{len(mismatches)} MISMATCHES"
+    print(f"{label:<10} {len(cases):>8} calls {elapsed:>8.2f} s {len(cases) / elapsed:>10.0f} calls/s  {status}")
+    for i in mismatches[:5]:
+        name, kwargs = cases[i]
+        print(f"   {name}({kwargs}): serial {expected[i]!r}, concurrent {actual[i]!r}")
+    return len(mismatches)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20000, help="node executions per run")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--quick", action="store_true", help="2000 calls")
+    args = parser.parse_args(argv)
+
+    cases = make_cases(2000 if args.quick else args.calls)
+    failures = 0
+
+    random.seed(12345)
+    state = random.getstate()
+    start = time.perf_counter()
+    expected = run_chunk(cases)
+    print(f"{'serial':<10} {len(cases):>8} calls {time.perf_counter() - start:>8.2f} s")
+    if random.getstate() != state:
+        print("   the nodes changed the global `random` state")
+        failures += 1
+
+    # Switch threads as often as possible to maximise interleaving.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    stop = threading.Event()
+    noise = threading.Thread(target=_interfere, args=(stop,), daemon=True)
+    noise.start()
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.threads) as pool:
+            actual = list(pool.map(run_case, cases))
+        failures += compare("threads", cases, expected, actual, time.perf_counter() - start)
+    finally:
+        stop.set()
+        noise.join()
+        sys.setswitchinterval(interval)
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.processes) as pool:
+        chunks = _chunks(cases, max(1, len(cases) // (args.processes * 8)))
+        actual = [output for chunk in pool.map(run_chunk, chunks) for output in chunk]
+    failures += compare("processes", cases, expected, actual, time.perf_counter() - start)
+
+    print("\nAll concurrent runs match the serial run." if not failures else f"\n{failures} failures.")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""Benchmark and complexity-scaling suite for the wildcard engine.
+
+Runs without ComfyUI, using the stand-in in `comfy_api_stub.py`:
+
+    python benchmarks/wildcard_benchmark.py [--mode lazy] [--quick] [--strict]
+
+Synthetic prompts are scaled along three axes (number of wildcards, nesting depth,
+options per wildcard). For every size the suite reports the cold cost (parse plus
+first expansion), warm per-expansion latency and throughput, and peak allocation.
+Warm latency is then fitted against prompt size on a log-log scale; an axis whose
+slope exceeds `--max-slope` is flagged as super-linear.
+"""
+import argparse
+import math
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(_HERE))
+sys.path.insert(0, _HERE)
+
+from comfy_api_stub import install  # noqa: E402
+
+install()
+
+from nodes.prompt_wildcards.simple_wildcard_picker import _process_wildcards  # noqa: E402
+from nodes.prompt_wildcards.wildcard_engine import EXPANSION_MODES, compile_prompt  # noqa: E402
+
+# Each axis maps a size to a synthetic prompt that grows along that axis only.
+AXES = {
+    "length": lambda size: make_prompt(length=size, depth=2, width=4),
+    "depth": lambda size: make_prompt(length=1, depth=size, width=2),
+    "width": lambda size: make_prompt(length=4, depth=1, width=size),
+}
+SIZES = {
+    "length": [16, 64, 256, 1024],
+    "depth": [16, 128, 1024, 4096],
+    "width": [16, 128, 1024, 8192],
+}
+QUICK_SIZES = {
+    "length": [16, 64, 256],
+    "depth": [16, 128, 1024],
+    "width": [16, 128, 1024],
+}
+
+
+def make_prompt(length: int, depth: int, width: int) -> str:
+    """Build `length` wildcards joined by text, each `depth` levels deep with `width` options.
+
+    The first option of every level holds the next level, so the prompt grows linearly
+    along each axis.
+    """
+    groups = []
+    for group in range(length):
+        inner = f"core{group}"
+        for level in range(depth):
+            options = [f"{inner} l{level}"] + [f"opt{group}_{level}_{k}" for k in range(1, width)]
+            inner = "{" + "|".join(options) + "}"
+        groups.append(inner)
+    return "a photo of " + ", ".join(groups) + ", highly detailed"
+
+
+def measure(prompt: str, mode: str, budget: float) -> dict:
+    """Measure one prompt: cold cost, warm latency distribution and peak allocation."""
+    compile_prompt.cache_clear()
+    start = time.perf_counter()
+    _process_wildcards(prompt, 0, mode)
+    cold = time.perf_counter() - start
+
+    latencies = []
+    deadline = time.perf_counter() + budget
+    seed = 1
+    while len(latencies) < 5 or (time.perf_counter() < deadline and len(latencies) < 100000):
+        start = time.perf_counter_ns()
+        _process_wildcards(prompt, seed, mode)
+        latencies.append(time.perf_counter_ns() - start)
+        seed += 1
+    latencies.sort()
+
+    compile_prompt.cache_clear()
+    tracemalloc.start()
+    _process_wildcards(prompt, 0, mode)
+    for seed in range(1, 21):
+        _process_wildcards(prompt, seed, mode)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "chars": len(prompt),
+        "cold_ms": cold * 1e3,
+        "median_us": statistics.median(latencies) / 1e3,
+        "p95_us": latencies[int(0.95 * (len(latencies) - 1))] / 1e3,
+        "per_sec": 1e9 * len(latencies) / sum(latencies),
+        "peak_kib": peak / 1024,
+    }
+
+
+def scaling_slope(rows: list, key: str) -> float:
+    """Largest log-log slope of `key` against prompt size between consecutive sizes."""
+    slopes = []
+    for previous, current in zip(rows, rows[1:]):
+        if previous[key] <= 0 or current[key] <= 0:
+            continue
+        slopes.append(
+            math.log(current[key] / previous[key]) / math.log(current["chars"] / previous["chars"])
+        )
+    return max(slopes) if slopes else 0.0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=EXPANSION_MODES, default="legacy")
+    parser.add_argument("--axis", choices=sorted(AXES), action="append", help="axis to run (repeatable)")
+    parser.add_argument("--quick", action="store_true", help="fewer and smaller sizes")
+    parser.add_argument("--budget", type=float, default=0.25, help="seconds of warm sampling per size")
+    parser.add_argument("--max-slope", type=float, default=1.25, help="flag log-log slopes above this")
+    parser.add_argument("--strict", action="store_true", help="exit with status 1 if any axis is flagged")
+    args = parser.parse_args(argv)
+
+    sizes = QUICK_SIZES if args.quick else SIZES
+    flagged = []
+    header = f"{'size':>7} {'chars':>9} {'cold ms':>9} {'median us':>10} {'p95 us':>10} {'exp/s':>10} {'peak KiB':>9}"
+    for axis in args.axis or sorted(AXES):
+        print(f"\n== {axis} (mode={args.mode})")
+        print(header)
+        rows = []
+        for size in sizes[axis]:
+            row = measure(AXES[axis](size), args.mode, args.budget)
+            rows.append(row)
+            print(
+                f"{size:>7} {row['chars']:>9} {row['cold_ms']:>9.2f} {row['median_us']:>10.1f} "
+                f"{row['p95_us']:>10.1f} {row['per_sec']:>10.0f} {row['peak_kib']:>9.1f}"
+            )
+        for key in ("median_us", "cold_ms"):
+            slope = scaling_slope(rows, key)
+            status = "SUPER-LINEAR" if slope > args.max_slope else "ok"
+            print(f"   {key} scaling slope {slope:.2f} -> {status}")
+            if status != "ok":
+                flagged.append(f"{axis}/{key}")
+
+    if flagged:
+        print(f"\nFlagged: {', '.join(flagged)}")
+        return 1 if args.strict else 0
+    print("\nNo super-linear scaling detected.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
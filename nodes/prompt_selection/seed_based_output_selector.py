@@ -1,5 +1,20 @@
 from comfy_api.latest import io
 
+INPUT_NAMES = [f"input_{index}" for index in range(1, 11)]
+
+
+def _select_input(seed_number: int, inputs: dict) -> str | None:
+    """Name of the input the seed selects, or None when there is nothing to select.
+
+    Inputs are lazy: a connected input that has not been evaluated yet arrives as None
+    and counts as a candidate. Empty strings do not count, so if the selected input
+    evaluates to "" the selection is made again among the remaining candidates.
+    """
+    candidates = [name for name in INPUT_NAMES if name in inputs and inputs[name] != ""]
+    if not candidates:
+        return None
+    return candidates[seed_number % len(candidates)]
+
 
 class SeedBasedOutputSelector(io.ComfyNode):
     @classmethod
@@ -15,22 +30,30 @@ class SeedBasedOutputSelector(io.ComfyNode):
                     min=0,
                     max=0xFFFFFFFFFFFFFFFF,
                 ),
-                io.String.Input("input_1", default=""),
-                io.String.Input("input_2", default=""),
-                io.String.Input("input_3", default=""),
-                io.String.Input("input_4", default=""),
-                io.String.Input("input_5", default=""),
-                io.String.Input("input_6", default=""),
-                io.String.Input("input_7", default=""),
-                io.String.Input("input_8", default=""),
-                io.String.Input("input_9", default=""),
-                io.String.Input("input_10", default=""),
+                io.String.Input("input_1", default="", lazy=True),
+                io.String.Input("input_2", default="", lazy=True),
+                io.String.Input("input_3", default="", lazy=True),
+                io.String.Input("input_4", default="", lazy=True),
+                io.String.Input("input_5", default="", lazy=True),
+                io.String.Input("input_6", default="", lazy=True),
+                io.String.Input("input_7", default="", lazy=True),
+                io.String.Input("input_8", default="", lazy=True),
+                io.String.Input("input_9", default="", lazy=True),
+                io.String.Input("input_10", default="", lazy=True),
             ],
             outputs=[
                 io.String.Output(),
             ],
         )
 
+    @classmethod
+    def check_lazy_status(cls, seed_number: int, **inputs) -> list:
+        """Request only the input the seed selects; the other branches never run."""
+        selected = _select_input(seed_number, inputs)
+        if selected is not None and inputs[selected] is None:
+            return [selected]
+        return []
+
     @classmethod
     def execute(
         cls,
@@ -46,29 +69,23 @@ class SeedBasedOutputSelector(io.ComfyNode):
         input_9: str = "",
         input_10: str = "",
     ) -> io.NodeOutput:
-        """Select an output based on the seed number and available non-null inputs."""
+        """Select an output based on the seed number and the available non-empty inputs."""
 
-        inputs = [
-            input_1,
-            input_2,
-            input_3,
-            input_4,
-            input_5,
-            input_6,
-            input_7,
-            input_8,
-            input_9,
-            input_10,
-        ]
+        inputs = {
+            "input_1": input_1,
+            "input_2": input_2,
+            "input_3": input_3,
+            "input_4": input_4,
+            "input_5": input_5,
+            "input_6": input_6,
+            "input_7": input_7,
+            "input_8": input_8,
+            "input_9": input_9,
+            "input_10": input_10,
+        }
 
-        # Treat both None and empty strings as "no value" for optional inputs
-        non_empty_inputs = [value for value in inputs if value not in (None, "")]
-        num_outputs = len(non_empty_inputs)
-
-        if num_outputs == 0:
+        selected = _select_input(seed_number, inputs)
+        if selected is None or inputs[selected] is None:
             return io.NodeOutput("")
 
-        output_index = seed_number % num_outputs
-        final_output = non_empty_inputs[output_index]
-
-        return io.NodeOutput(final_output)
+        return io.NodeOutput(inputs[selected])
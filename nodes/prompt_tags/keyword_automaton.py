@@ -0,0 +1,124 @@
+from collections import deque
+from functools import lru_cache
+
+# Number of distinct keyword dictionaries kept as built automata.
+KEYWORD_AUTOMATON_CACHE_SIZE = 32
+
+
+class KeywordAutomaton:
+    """Aho–Corasick automaton over a keyword -> replacement dictionary.
+
+    States are integers; `_goto[s]` maps a character to the next state, `_fail[s]` is
+    the longest proper suffix of state `s` that is also a trie state, and
+    `_output[s]` the nearest state on the fail chain (including `s`) that ends a
+    keyword. Matching is leftmost-longest and non-overlapping, so the cost of a
+    replacement pass depends on the text, not on how many keywords there are.
+    """
+
+    __slots__ = ("replacements", "_goto", "_fail", "_output", "_keyword", "_depth")
+
+    def __init__(self, replacements: dict):
+        self.replacements = replacements
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [0]
+        self._keyword = [None]
+        self._depth = [0]
+
+        for keyword in replacements:
+            if not keyword:
+                continue
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(0)
+                    self._keyword.append(None)
+                    self._depth.append(self._depth[state] + 1)
+                state = next_state
+            self._keyword[state] = keyword
+
+        # Breadth-first, so every fail target is finished before the states that use it.
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            fail = self._fail[state]
+            self._output[state] = state if self._keyword[state] is not None else self._output[fail]
+            for char, child in self._goto[state].items():
+                target = fail
+                while target and char not in self._goto[target]:
+                    target = self._fail[target]
+                self._fail[child] = self._goto[target].get(char, 0)
+                queue.append(child)
+
+    def matches(self, text: str, whole_words: bool = False):
+        """Yield `(start, end, keyword)` for the leftmost-longest, non-overlapping matches.
+
+        The scan keeps going past a match only until no later match can start at or
+        before it (the current state is shallower than the distance to the match
+        start), then resumes at the match end. With `whole_words` a match must not
+        sit inside a word (letters, digits or `_` on either side).
+        """
+        goto, fail, output, keyword_at, depth = self._goto, self._fail, self._output, self._keyword, self._depth
+        length = len(text)
+        position = 0
+        while position < length:
+            state = 0
+            best = None
+            index = position
+            while index < length:
+                char = text[index]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(char, 0)
+                end = index + 1
+                # The first keyword on the output chain is the longest one ending here,
+                # so it has the earliest start of all matches ending at `end`.
+                candidate = output[state]
+                while candidate:
+                    start = end - depth[candidate]
+                    if not whole_words or _on_word_boundaries(text, start, end):
+                        if best is None or start <= best[0]:
+                            best = (start, end, keyword_at[candidate])
+                        break
+                    candidate = output[fail[candidate]]
+                if best is not None and best[0] < end - depth[state]:
+                    break
+                index += 1
+            if best is None:
+                return
+            yield best
+            position = best[1]
+
+    def replace(self, text: str, whole_words: bool = False) -> tuple[str, list]:
+        """Replace every match with its replacement; returns the text and matched keywords."""
+        pieces = []
+        found = []
+        position = 0
+        for start, end, keyword in self.matches(text, whole_words):
+            pieces.append(text[position:start])
+            pieces.append(self.replacements[keyword])
+            found.append(keyword)
+            position = end
+        pieces.append(text[position:])
+        return "".join(pieces), found
+
+
+def _on_word_boundaries(text: str, start: int, end: int) -> bool:
+    before = text[start - 1] if start > 0 else " "
+    after = text[end] if end < len(text) else " "
+    return not (before.isalnum() or before == "_") and not (after.isalnum() or after == "_")
+
+
+@lru_cache(maxsize=KEYWORD_AUTOMATON_CACHE_SIZE)
+def _compile_keywords(items: tuple) -> KeywordAutomaton:
+    return KeywordAutomaton(dict(items))
+
+
+def compile_keywords(replacements: dict) -> KeywordAutomaton:
+    """Return the automaton for `replacements`, built once per distinct dictionary."""
+    return _compile_keywords(tuple(replacements.items()))
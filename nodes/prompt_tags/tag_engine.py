@@ -0,0 +1,183 @@
+import json
+import re
+from functools import lru_cache
+
+# Placeholders look like `__location__`; the name is everything between the underscores.
+PLACEHOLDER_PATTERN = re.compile(r"__(.*?)__")
+
+# Number of distinct templates kept in compiled form.
+COMPILED_TEMPLATE_CACHE_SIZE = 256
+
+
+class CompiledTemplate:
+    """A template pre-split into literal text and placeholder slots.
+
+    `segments` alternates literal text and the placeholder tokens as typed, so
+    rendering only swaps the slot entries for tag values and joins once.
+    """
+
+    __slots__ = ("segments", "slots", "placeholders", "names")
+
+    def __init__(self, template: str):
+        self.segments = []
+        self.slots = []  # (index into segments, placeholder name)
+        self.placeholders = []
+        position = 0
+        for match in PLACEHOLDER_PATTERN.finditer(template):
+            self.segments.append(template[position:match.start()])
+            self.slots.append((len(self.segments), match.group(1)))
+            self.segments.append(match.group(0))
+            self.placeholders.append(match.group(1))
+            position = match.end()
+        self.segments.append(template[position:])
+        self.names = frozenset(self.placeholders)
+
+    def render(self, data: dict) -> str:
+        """Fill the slots from `data`; slots without a value (missing or None) keep their token."""
+        segments = self.segments.copy()
+        for index, key in self.slots:
+            value = data.get(key)
+            if value is not None:
+                segments[index] = value
+        return "".join(segments)
+
+
+@lru_cache(maxsize=COMPILED_TEMPLATE_CACHE_SIZE)
+def compile_template(template: str) -> CompiledTemplate:
+    """Return the compiled form of `template`, reusing it across executions."""
+    return CompiledTemplate(template)
+
+
+def template_cache_info():
+    """Hit/miss counters and size of the compiled template cache (`functools` cache info)."""
+    return compile_template.cache_info()
+
+
+def lazy_tag_inputs(template: str, inputs: dict) -> list:
+    """Names of unevaluated `tag_N` inputs whose `tag_name_N` the template needs.
+
+    Used by `check_lazy_status`: lazy inputs that have not been evaluated yet arrive as
+    None. A tag is needed if the template references it, or if an already evaluated
+    tag that is needed references it in its value (see `resolve_tags`); ComfyUI calls
+    `check_lazy_status` again after each round, so nested tags are requested as soon
+    as the value naming them is known.
+    """
+    values = {}
+    pending = {}
+    for input_name, value in inputs.items():
+        if not input_name.startswith("tag_") or input_name.startswith("tag_name_"):
+            continue
+        tag_name = inputs.get("tag_name_" + input_name[len("tag_"):])
+        if value is None:
+            pending[input_name] = tag_name
+        elif tag_name is not None:
+            values.setdefault(tag_name, []).append(value)
+
+    needed_names = set()
+    queue = list(compile_template(template).names)
+    while queue:
+        name = queue.pop()
+        if name in needed_names:
+            continue
+        needed_names.add(name)
+        for value in values.get(name, ()):
+            # Tag values change per run; keep them out of the template cache.
+            queue.extend(CompiledTemplate(value).names)
+
+    return [
+        input_name for input_name, tag_name in pending.items()
+        if tag_name is None or tag_name in needed_names
+    ]
+
+
+@lru_cache(maxsize=COMPILED_TEMPLATE_CACHE_SIZE)
+def _parse_tag_block(block: str) -> tuple:
+    if block.lstrip().startswith("{"):
+        try:
+            mapping = json.loads(block)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON tag mapping: {e}") from e
+        if not isinstance(mapping, dict):
+            raise ValueError("JSON tag mapping must be an object.")
+        return tuple((str(key), None if value is None else str(value)) for key, value in mapping.items())
+
+    items = []
+    for line_number, line in enumerate(block.splitlines(), start=1):
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        key, separator, value = line.partition("=")
+        if separator and key.strip():
+            items.append([key.strip(), value.strip()])
+        elif items:
+            # A line without `key=` continues the previous value on a new line.
+            items[-1][1] += "\n" + stripped
+        else:
+            raise ValueError(f"Expected 'name=value' on line {line_number}.")
+    return tuple((key, value) for key, value in items)
+
+
+def parse_tag_block(block: str) -> dict:
+    """Parse a tag mapping typed into a text box.
+
+    Either a JSON object, or one `name=value` per line (blank lines and `#` comments
+    are skipped, and a line without `=` continues the previous value). A JSON `null`
+    maps to None, which like a missing tag leaves the placeholder as typed. Parsed
+    blocks are cached by their text, since the block usually stays fixed across a queue.
+    """
+    return dict(_parse_tag_block(block))
+
+
+def resolve_tags(names, data: dict) -> dict:
+    """Expand placeholders inside tag values, for every tag reachable from `names`.
+
+    Tag values are templates themselves (`outfit = "__color__ __garment__"`). The tags
+    form a dependency graph that is walked depth-first without recursion; each tag is
+    rendered once, after all of its dependencies (topological order), and memoized.
+    Raises ValueError naming the cycle if tags depend on each other circularly.
+    Values are compiled once per call without `compile_template`, so per-run values
+    do not displace templates from its cache.
+    """
+    resolved = {}
+    visiting = set()
+    compiled = {}
+
+    def value_template(name):
+        if name not in compiled:
+            compiled[name] = CompiledTemplate(data[name])
+        return compiled[name]
+
+    for root in names:
+        if root in resolved or data.get(root) is None:
+            continue
+        visiting.add(root)
+        stack = [(root, iter(value_template(root).placeholders))]
+        while stack:
+            name, dependencies = stack[-1]
+            for dependency in dependencies:
+                if dependency in resolved or data.get(dependency) is None:
+                    continue
+                if dependency in visiting:
+                    path = [entry[0] for entry in stack]
+                    cycle = path[path.index(dependency):] + [dependency]
+                    raise ValueError(f"Circular tag reference: {' -> '.join(cycle)}")
+                visiting.add(dependency)
+                stack.append((dependency, iter(value_template(dependency).placeholders)))
+                break
+            else:
+                stack.pop()
+                visiting.discard(name)
+                resolved[name] = value_template(name).render(resolved)
+    return resolved
+
+
+def inject_tags(template: str, data: dict) -> tuple[str, list]:
+    """Replace every `__name__` placeholder in `template` with `data[name]` in a single pass.
+
+    Tag values may contain placeholders of their own; those are resolved first (see
+    `resolve_tags`). Placeholders without a value in `data` (missing or None) are left
+    as they are. Returns the filled template and the template's placeholder names in
+    order of appearance.
+    """
+    compiled = compile_template(template)
+    return compiled.render(resolve_tags(compiled.placeholders, data)), list(compiled.placeholders)
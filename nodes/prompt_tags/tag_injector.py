@@ -1,6 +1,7 @@
-import re
 from comfy_api.latest import io
 
+from .tag_engine import inject_tags, lazy_tag_inputs
+
 
 class TagInjectorSingle(io.ComfyNode):
     def __init__(self):
@@ -14,7 +15,7 @@ class TagInjectorSingle(io.ComfyNode):
                                         "default": "__elements__"}),
             },
             "optional": {
-                "tag_1": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True}),
+                "tag_1": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True, "lazy": True}),
                 "tag_name_1": ('STRING', {"default": "elements"}),
             }
         }
@@ -40,6 +41,7 @@ class TagInjectorSingle(io.ComfyNode):
                     "tag_1",
                     multiline=True,
                     default="",
+                    lazy=True,
                 ),
                 io.String.Input(
                     "tag_name_1",
@@ -52,6 +54,11 @@ class TagInjectorSingle(io.ComfyNode):
             ],
         )
 
+    @classmethod
+    def check_lazy_status(cls, template: str, **kwargs) -> list:
+        """Only evaluate the tag inputs whose placeholder appears in the template."""
+        return lazy_tag_inputs(template, kwargs)
+
     @classmethod
     def execute(
         cls,
@@ -74,18 +81,8 @@ class TagInjectorSingle(io.ComfyNode):
         # Create a dictionary to hold the tag value for the tag name
         data = {tag_name_1: tag_1}
 
-        # Find placeholders in the template (e.g., __location__)
-        placeholders = re.findall(r'__(.*?)__', template)
-
-        # Fill placeholders with the corresponding tag value or default to the placeholder itself
-        data_with_defaults = {key: data.get(key, f"__{key}__") for key in placeholders}
-
-        # Replace each placeholder in the template with the corresponding tag value
-        for key, value in data_with_defaults.items():
-            template = template.replace(f"__{key}__", value)
-
-        # Return the modified template and the list of placeholders used
-        return template, placeholders
+        # Fill each placeholder with its tag value in one pass; unknown placeholders stay as they are
+        return inject_tags(template, data)
 
 
 class TagInjectorDuo(io.ComfyNode):
@@ -100,8 +97,8 @@ class TagInjectorDuo(io.ComfyNode):
                                         "default": "__elements__"}),
             },
             "optional": {
-                "tag_1": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True}),
-                "tag_2": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True}),
+                "tag_1": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True, "lazy": True}),
+                "tag_2": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True, "lazy": True}),
                 "tag_name_1": ('STRING', {"default": "elements"}),
                 "tag_name_2": ('STRING', {"default": "stuff"}),
             }
@@ -128,11 +125,13 @@ class TagInjectorDuo(io.ComfyNode):
                     "tag_1",
                     multiline=True,
                     default="",
+                    lazy=True,
                 ),
                 io.String.Input(
                     "tag_2",
                     multiline=True,
                     default="",
+                    lazy=True,
                 ),
                 io.String.Input(
                     "tag_name_1",
@@ -149,6 +148,11 @@ class TagInjectorDuo(io.ComfyNode):
             ],
         )
 
+    @classmethod
+    def check_lazy_status(cls, template: str, **kwargs) -> list:
+        """Only evaluate the tag inputs whose placeholder appears in the template."""
+        return lazy_tag_inputs(template, kwargs)
+
     @classmethod
     def execute(
         cls,
@@ -176,18 +180,8 @@ class TagInjectorDuo(io.ComfyNode):
         # Create a dictionary to hold tag values for each tag name
         data = {tag_name_1: tag_1, tag_name_2: tag_2}
 
-        # Find placeholders in the template (e.g., __location__, __weather__, etc.)
-        placeholders = re.findall(r'__(.*?)__', template)
-
-        # Fill placeholders with the corresponding tag value or default to the placeholder itself
-        data_with_defaults = {key: data.get(key, f"__{key}__") for key in placeholders}
-
-        # Replace each placeholder in the template with the corresponding tag value
-        for key, value in data_with_defaults.items():
-            template = template.replace(f"__{key}__", value)
-
-        # Return the modified template and the list of placeholders used
-        return template, placeholders
+        # Fill each placeholder with its tag value in one pass; unknown placeholders stay as they are
+        return inject_tags(template, data)
 
 
 class TagInjector(io.ComfyNode):
@@ -202,9 +196,9 @@ class TagInjector(io.ComfyNode):
                                         "default": "__elements__"}),
             },
             "optional": {
-                "tag_1": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True}),
-                "tag_2": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True}),
-                "tag_3": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True}),
+                "tag_1": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True, "lazy": True}),
+                "tag_2": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True, "lazy": True}),
+                "tag_3": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True, "lazy": True}),
                 "tag_name_1": ('STRING', {"default": "elements"}),
                 "tag_name_2": ('STRING', {"default": "stuff"}),
                 "tag_name_3": ('STRING', {"default": "things"}),
@@ -232,16 +226,19 @@ class TagInjector(io.ComfyNode):
                     "tag_1",
                     multiline=True,
                     default="",
+                    lazy=True,
                 ),
                 io.String.Input(
                     "tag_2",
                     multiline=True,
                     default="",
+                    lazy=True,
                 ),
                 io.String.Input(
                     "tag_3",
                     multiline=True,
                     default="",
+                    lazy=True,
                 ),
                 io.String.Input(
                     "tag_name_1",
@@ -262,6 +259,11 @@ class TagInjector(io.ComfyNode):
             ],
         )
 
+    @classmethod
+    def check_lazy_status(cls, template: str, **kwargs) -> list:
+        """Only evaluate the tag inputs whose placeholder appears in the template."""
+        return lazy_tag_inputs(template, kwargs)
+
     @classmethod
     def execute(
         cls,
@@ -296,15 +298,5 @@ class TagInjector(io.ComfyNode):
             tag_name_1: tag_1, tag_name_2: tag_2, tag_name_3: tag_3
         }
 
-        # Find placeholders in the template (e.g., __location__, __weather__, etc.)
-        placeholders = re.findall(r'__(.*?)__', template)
-
-        # Fill placeholders with the corresponding tag value or default to the placeholder itself
-        data_with_defaults = {key: data.get(key, f"__{key}__") for key in placeholders}
-
-        # Replace each placeholder in the template with the corresponding tag value
-        for key, value in data_with_defaults.items():
-            template = template.replace(f"__{key}__", value)
-
-        # Return the modified template and the list of placeholders used
-        return template, placeholders
+        # Fill each placeholder with its tag value in one pass; unknown placeholders stay as they are
+        return inject_tags(template, data)
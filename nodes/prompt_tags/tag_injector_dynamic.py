@@ -0,0 +1,119 @@
+from comfy_api.latest import io
+
+from .keyword_automaton import compile_keywords
+from .tag_engine import inject_tags, parse_tag_block
+
+# Type of the structured tag mapping input: a dict of tag name -> value.
+TAG_MAP_TYPE = "GR85_TAG_MAP"
+
+# "placeholders" fills `__name__` tokens; "keywords" replaces the bare tag names themselves.
+MATCH_MODES = ("placeholders", "keywords")
+
+
+def _tag_map_items(tag_map: dict):
+    # Names and values as strings; None stays None (no value, the placeholder is kept).
+    return ((str(key), None if value is None else str(value)) for key, value in tag_map.items())
+
+
+class TagMapBuilder(io.ComfyNode):
+    """Build a `GR85_TAG_MAP` from a `name=value` (or JSON) text block.
+
+    An optional incoming map is merged underneath, so builders can be chained; values
+    from the text block win. The result feeds the `tag_map` input of TagInjectorDynamic.
+    """
+
+    @classmethod
+    def define_schema(cls) -> io.Schema:
+        return io.Schema(
+            node_id="GR85_TagMapBuilder",
+            display_name="Tag Map Builder",
+            category="GR85/Prompt/Tags",
+            inputs=[
+                io.String.Input(
+                    "tags",
+                    multiline=True,
+                    default="",
+                ),
+                io.Custom(TAG_MAP_TYPE).Input(
+                    "tag_map",
+                    optional=True,
+                ),
+            ],
+            outputs=[
+                io.Custom(TAG_MAP_TYPE).Output(),
+            ],
+        )
+
+    @classmethod
+    def execute(cls, tags: str = "", tag_map: dict | None = None) -> io.NodeOutput:
+        merged = dict(_tag_map_items(tag_map)) if tag_map else {}
+        merged.update(parse_tag_block(tags))
+        return io.NodeOutput(merged)
+
+
+class TagInjectorDynamic(io.ComfyNode):
+    """Inject any number of named tags into a template in a single pass.
+
+    Tags come from a `name=value` (or JSON) text block and/or a structured
+    `GR85_TAG_MAP` input (built with TagMapBuilder); structured values win over the
+    text block. A None value, like JSON `null`, leaves the placeholder as typed; a
+    malformed text block raises ValueError, as in TagMapBuilder. In
+    "keywords" mode the names are bare keywords or phrases matched leftmost-longest
+    by an Aho–Corasick automaton that is built once per dictionary.
+    """
+
+    @classmethod
+    def define_schema(cls) -> io.Schema:
+        return io.Schema(
+            node_id="GR85_TagInjectorDynamic",
+            display_name="Tag Injector Dynamic",
+            category="GR85/Prompt/Tags",
+            inputs=[
+                io.String.Input(
+                    "template",
+                    multiline=True,
+                    default="__elements__",
+                ),
+                io.String.Input(
+                    "tags",
+                    multiline=True,
+                    default="",
+                ),
+                io.Combo.Input(
+                    "match_mode",
+                    options=list(MATCH_MODES),
+                    default="placeholders",
+                ),
+                io.Boolean.Input(
+                    "whole_words",
+                    default=True,
+                ),
+                io.Custom(TAG_MAP_TYPE).Input(
+                    "tag_map",
+                    optional=True,
+                ),
+            ],
+            outputs=[
+                io.String.Output(),
+                io.String.Output(),
+            ],
+        )
+
+    @classmethod
+    def execute(
+        cls,
+        template: str,
+        tags: str = "",
+        match_mode: str = "placeholders",
+        whole_words: bool = True,
+        tag_map: dict | None = None,
+    ) -> io.NodeOutput:
+        data = parse_tag_block(tags)
+        if tag_map:
+            data.update(_tag_map_items(tag_map))
+        if match_mode == "keywords":
+            replacements = {key: value for key, value in data.items() if value is not None}
+            tagged_text, placeholders = compile_keywords(replacements).replace(template, whole_words)
+        else:
+            tagged_text, placeholders = inject_tags(template, data)
+        return io.NodeOutput(tagged_text, placeholders)
@@ -1,6 +1,7 @@
-import re
 from comfy_api.latest import io
 
+from .tag_engine import inject_tags, lazy_tag_inputs
+
 
 class TagInjectorLarge(io.ComfyNode):
     def __init__(self):
@@ -14,16 +15,16 @@ class TagInjectorLarge(io.ComfyNode):
                                         "default": "In a __location__ under a __weather__ sky, a __personality__ person shows __emotion__ while wearing __style__. The __time__ is perfect for a __action__ amidst __mood__."}),
             },
             "optional": {
-                "tag_1": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True}),
-                "tag_2": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True}),
-                "tag_3": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True}),
-                "tag_4": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True}),
-                "tag_5": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True}),
-                "tag_6": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True}),
-                "tag_7": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True}),
-                "tag_8": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True}),
-                "tag_9": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True}),
-                "tag_10": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True}),
+                "tag_1": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True, "lazy": True}),
+                "tag_2": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True, "lazy": True}),
+                "tag_3": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True, "lazy": True}),
+                "tag_4": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True, "lazy": True}),
+                "tag_5": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True, "lazy": True}),
+                "tag_6": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True, "lazy": True}),
+                "tag_7": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True, "lazy": True}),
+                "tag_8": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True, "lazy": True}),
+                "tag_9": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True, "lazy": True}),
+                "tag_10": ('STRING', {"forceInput": True, "multiline": True, "dynamicPrompts": True, "lazy": True}),
                 "tag_name_1": ('STRING', {"default": "location"}),
                 "tag_name_2": ('STRING', {"default": "color"}),
                 "tag_name_3": ('STRING', {"default": "object"}),
@@ -58,16 +59,16 @@ class TagInjectorLarge(io.ComfyNode):
                         "amidst __mood__."
                     ),
                 ),
-                io.String.Input("tag_1", multiline=True, default=""),
-                io.String.Input("tag_2", multiline=True, default=""),
-                io.String.Input("tag_3", multiline=True, default=""),
-                io.String.Input("tag_4", multiline=True, default=""),
-                io.String.Input("tag_5", multiline=True, default=""),
-                io.String.Input("tag_6", multiline=True, default=""),
-                io.String.Input("tag_7", multiline=True, default=""),
-                io.String.Input("tag_8", multiline=True, default=""),
-                io.String.Input("tag_9", multiline=True, default=""),
-                io.String.Input("tag_10", multiline=True, default=""),
+                io.String.Input("tag_1", multiline=True, default="", lazy=True),
+                io.String.Input("tag_2", multiline=True, default="", lazy=True),
+                io.String.Input("tag_3", multiline=True, default="", lazy=True),
+                io.String.Input("tag_4", multiline=True, default="", lazy=True),
+                io.String.Input("tag_5", multiline=True, default="", lazy=True),
+                io.String.Input("tag_6", multiline=True, default="", lazy=True),
+                io.String.Input("tag_7", multiline=True, default="", lazy=True),
+                io.String.Input("tag_8", multiline=True, default="", lazy=True),
+                io.String.Input("tag_9", multiline=True, default="", lazy=True),
+                io.String.Input("tag_10", multiline=True, default="", lazy=True),
                 io.String.Input("tag_name_1", default="location"),
                 io.String.Input("tag_name_2", default="color"),
                 io.String.Input("tag_name_3", default="object"),
@@ -85,6 +86,11 @@ class TagInjectorLarge(io.ComfyNode):
             ],
         )
 
+    @classmethod
+    def check_lazy_status(cls, template: str, **kwargs) -> list:
+        """Only evaluate the tag inputs whose placeholder appears in the template."""
+        return lazy_tag_inputs(template, kwargs)
+
     @classmethod
     def execute(
         cls,
@@ -152,15 +158,5 @@ class TagInjectorLarge(io.ComfyNode):
             tag_name_9: tag_9, tag_name_10: tag_10
         }
 
-        # Find placeholders in the template (e.g., __location__, __weather__, etc.)
-        placeholders = re.findall(r'__(.*?)__', template)
-
-        # Fill placeholders with the corresponding tag value or default to the placeholder itself
-        data_with_defaults = {key: data.get(key, f"__{key}__") for key in placeholders}
-
-        # Replace each placeholder in the template with the corresponding tag value
-        for key, value in data_with_defaults.items():
-            template = template.replace(f"__{key}__", value)
-
-        # Return the modified template and the list of placeholders used
-        return template, placeholders
+        # Fill each placeholder with its tag value in one pass; unknown placeholders stay as they are
+        return inject_tags(template, data)
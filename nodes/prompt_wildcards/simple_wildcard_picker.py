@@ -1,58 +1,21 @@
-from random import Random
-import re
 from comfy_api.latest import io
 
+from .wildcard_engine import ENUMERATION_ORDERS, EXPANSION_MODES, compile_prompt, expand_seed_range
+from .wildcard_files import resolve_wildcard_dir
 
-def _process_wildcards(prompt: str, seed: int) -> str:
-    """Process wildcards using a seed to produce stable output, with support for nested wildcards."""
-    rng = Random(seed)
 
-    def replace_nested_wildcards(p: str) -> str:
-        # Base case: no wildcards left
-        if "{" not in p:
-            return p
-
-        result = ""
-        i = 0
-        while i < len(p):
-            if p[i] == "{":
-                # Find the matching closing brace
-                depth = 1
-                j = i + 1
-                while j < len(p) and depth > 0:
-                    if p[j] == "{":
-                        depth += 1
-                    elif p[j] == "}":
-                        depth -= 1
-                    j += 1
-                if depth == 0:
-                    # Extract the content inside the braces
-                    content = p[i + 1 : j - 1]
-                    if not content:
-                        raise ValueError(f"Empty wildcard found at position {i}.")
-                    # Recursively replace nested wildcards in content
-                    replaced_content = replace_nested_wildcards(content)
-                    # Split options and pick one
-                    options = replaced_content.split("|")
-                    if not options:
-                        raise ValueError(f"No options found in wildcard at position {i}.")
-                    picked_option = options[rng.randint(0, len(options) - 1)]
-                    # Add to result
-                    result += picked_option
-                    i = j
-                else:
-                    # Unmatched opening brace
-                    raise ValueError(f"Unmatched opening brace at position {i}.")
-            elif p[i] == "}":
-                # Unmatched closing brace
-                raise ValueError(f"Unmatched closing brace at position {i}.")
-            else:
-                result += p[i]
-                i += 1
-        return result
+def _process_wildcards(prompt: str, seed: int, mode: str = "legacy", wildcard_dir: str = "") -> str:
+    """Process wildcards using a seed to produce stable output, with support for nested wildcards.
 
+    The prompt is compiled once into a choice tree (cached by prompt text), so repeated
+    executions with different seeds only sample the tree. `mode` selects between the
+    "legacy" draw order (reproduces old seeds), "lazy" branch evaluation and "unique"
+    enumeration order.
+    `__name__` tokens are resolved against `wildcard_dir`, a subfolder of the wildcards
+    folder (the folder itself when empty).
+    """
     try:
-        return replace_nested_wildcards(prompt)
+        return compile_prompt(prompt).expand(seed, mode, resolve_wildcard_dir(wildcard_dir))
     except ValueError as e:
         # Handle errors (could log or re-raise)
         print(f"Error processing prompt: {e}")
@@ -78,6 +41,15 @@ class SimpleWildcardPicker(io.ComfyNode):
                     min=0,
                     max=0xffffffffffffffff,
                 ),
+                io.Combo.Input(
+                    "mode",
+                    options=list(EXPANSION_MODES),
+                    default="legacy",
+                ),
+                io.String.Input(
+                    "wildcard_dir",
+                    default="",
+                ),
             ],
             outputs=[
                 io.String.Output(),
@@ -85,6 +57,126 @@ class SimpleWildcardPicker(io.ComfyNode):
         )
 
     @classmethod
-    def execute(cls, prompt, seed) -> io.NodeOutput:
-        result = _process_wildcards(prompt, seed)
+    def execute(cls, prompt, seed, mode="legacy", wildcard_dir="") -> io.NodeOutput:
+        result = _process_wildcards(prompt, seed, mode, wildcard_dir)
         return io.NodeOutput(result)
+
+
+class SimpleWildcardPickerBatch(io.ComfyNode):
+    @classmethod
+    def define_schema(cls) -> io.Schema:
+        return io.Schema(
+            node_id="GR85_SimpleWildcardPickerBatch",
+            display_name="Simple Wildcard Picker (Batch)",
+            category="GR85/Prompt/Wildcards",
+            inputs=[
+                io.String.Input(
+                    "prompt",
+                    multiline=True,
+                    default="",
+                ),
+                io.Int.Input(
+                    "start_seed",
+                    default=0,
+                    min=0,
+                    max=0xffffffffffffffff,
+                ),
+                io.Int.Input(
+                    "count",
+                    default=16,
+                    min=1,
+                    max=100000,
+                ),
+                io.Int.Input(
+                    "workers",
+                    default=1,
+                    min=1,
+                    max=64,
+                ),
+                io.Combo.Input(
+                    "mode",
+                    options=list(EXPANSION_MODES),
+                    default="legacy",
+                ),
+                io.String.Input(
+                    "wildcard_dir",
+                    default="",
+                ),
+            ],
+            outputs=[
+                io.String.Output(is_output_list=True),
+            ],
+        )
+
+    @classmethod
+    def execute(cls, prompt, start_seed, count, workers=1, mode="legacy", wildcard_dir="") -> io.NodeOutput:
+        """Expand the prompt for `count` consecutive seeds starting at `start_seed`."""
+        try:
+            results = expand_seed_range(
+                prompt, start_seed, count, workers, mode, resolve_wildcard_dir(wildcard_dir)
+            )
+        except ValueError as e:
+            print(f"Error processing prompt: {e}")
+            results = [""] * count
+        return io.NodeOutput(results)
+
+
+class WildcardEnumerator(io.ComfyNode):
+    @classmethod
+    def define_schema(cls) -> io.Schema:
+        return io.Schema(
+            node_id="GR85_WildcardEnumerator",
+            display_name="Wildcard Enumerator",
+            category="GR85/Prompt/Wildcards",
+            inputs=[
+                io.String.Input(
+                    "prompt",
+                    multiline=True,
+                    default="",
+                ),
+                io.Int.Input(
+                    "offset",
+                    default=0,
+                    min=0,
+                    max=0xffffffffffffffff,
+                ),
+                io.Int.Input(
+                    "limit",
+                    default=16,
+                    min=1,
+                    max=100000,
+                ),
+                io.Combo.Input(
+                    "order",
+                    options=list(ENUMERATION_ORDERS),
+                    default="sequential",
+                ),
+                io.Int.Input(
+                    "key",
+                    default=0,
+                    min=0,
+                    max=0xffffffffffffffff,
+                ),
+                io.String.Input(
+                    "wildcard_dir",
+                    default="",
+                ),
+            ],
+            outputs=[
+                io.String.Output(is_output_list=True),
+                io.Int.Output(),
+            ],
+        )
+
+    @classmethod
+    def execute(cls, prompt, offset, limit, order="sequential", key=0, wildcard_dir="") -> io.NodeOutput:
+        """Return one page of the prompt's distinct expansions and the total number of expansions."""
+        try:
+            compiled = compile_prompt(prompt)
+            wildcard_dir = resolve_wildcard_dir(wildcard_dir)
+        except ValueError as e:
+            print(f"Error processing prompt: {e}")
+            return io.NodeOutput([], 0)
+        total = compiled.cardinality(wildcard_dir)
+        page = list(compiled.expansions(offset, limit, order, key, wildcard_dir))
+        return io.NodeOutput(page, total)
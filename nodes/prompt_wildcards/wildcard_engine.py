@@ -0,0 +1,470 @@
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from random import Random
+
+from ..random_numbers.counter_rng import GOLDEN_GAMMA, MASK64, mix64
+from .wildcard_files import DEFAULT_WILDCARD_DIR, load_wildcard_file, wildcard_file_stamp
+
+# Number of distinct prompt templates kept in compiled form.
+COMPILED_PROMPT_CACHE_SIZE = 256
+
+# "legacy" reproduces the original expander's draws; "lazy" only expands picked branches;
+# "unique" maps the seed through a permutation of all expansions, so consecutive seeds
+# never repeat an expansion until every one has been produced.
+EXPANSION_MODES = ("legacy", "lazy", "unique")
+
+# Orders in which `CompiledPrompt.expansions` walks the enumeration.
+ENUMERATION_ORDERS = ("sequential", "shuffled")
+
+# Characters that carry meaning in a wildcard prompt; everything else is literal text.
+_SPECIAL_CHARS = re.compile(r"[{}|]")
+
+# `{5::common|1::rare}`: an option may start with a non-negative weight followed by `::`.
+_WEIGHT_PREFIX = re.compile(r"\s*(\d+(?:\.\d*)?|\.\d+)::")
+
+# `__name__` tokens in literal text refer to `<wildcard dir>/<name>.txt`.
+_FILE_REFERENCE = re.compile(r"__([\w\-./]+?)__")
+
+
+class Choice:
+    """A `{a|b|c}` wildcard: a list of options, each a list of parts (str or Choice).
+
+    `index` is the position of the choice in closing-brace order, which is also the
+    order in which the legacy expander drew its random numbers. Weighted choices carry
+    a Walker/Vose alias table (`probability`, `alias`) so a draw is O(1).
+    """
+
+    __slots__ = ("options", "index", "weights", "probability", "alias")
+
+    def __init__(self, options: list, index: int, weights: list | None = None):
+        self.options = options
+        self.index = index
+        self.weights = weights
+        self.probability = None
+        self.alias = None
+        if weights is not None:
+            self.probability, self.alias = _alias_table(weights)
+
+    def draw(self, rng: Random) -> int:
+        """Pick an option index; unweighted choices draw exactly like the legacy expander."""
+        if self.alias is None:
+            return rng.randint(0, len(self.options) - 1)
+        scaled = rng.random() * len(self.options)
+        column = min(int(scaled), len(self.options) - 1)
+        return column if scaled - column < self.probability[column] else self.alias[column]
+
+
+def _alias_table(weights: list) -> tuple[list, list]:
+    """Build a Vose alias table: column `i` keeps itself with `probability[i]`, else `alias[i]`."""
+    count = len(weights)
+    total = sum(weights)
+    scaled = [weight * count / total for weight in weights]
+    probability = [1.0] * count
+    alias = list(range(count))
+    small = [i for i, value in enumerate(scaled) if value < 1.0]
+    large = [i for i, value in enumerate(scaled) if value >= 1.0]
+    while small and large:
+        low, high = small.pop(), large.pop()
+        probability[low] = scaled[low]
+        alias[low] = high
+        scaled[high] += scaled[low] - 1.0
+        (small if scaled[high] < 1.0 else large).append(high)
+    return probability, alias
+
+
+def _extract_weights(options: list) -> list | None:
+    """Strip `weight::` prefixes from the options; None when no option is weighted.
+
+    Options without a prefix weigh 1.
+    """
+    weights = None
+    for position, option in enumerate(options):
+        if not option or not isinstance(option[0], str):
+            continue
+        match = _WEIGHT_PREFIX.match(option[0])
+        if match is None:
+            continue
+        if weights is None:
+            weights = [1.0] * len(options)
+        weights[position] = float(match.group(1))
+        remainder = option[0][match.end():]
+        if remainder:
+            option[0] = remainder
+        else:
+            del option[0]
+    return weights
+
+
+class FileReference:
+    """A `__name__` token; resolves to a seeded line of `<name>.txt`, or stays as typed."""
+
+    __slots__ = ("name", "token")
+
+    def __init__(self, name: str, token: str):
+        self.name = name
+        self.token = token
+
+
+def _literal_parts(text: str) -> list:
+    """Split literal text into plain strings and FileReference tokens."""
+    if "__" not in text:
+        return [text]
+    parts = []
+    position = 0
+    for match in _FILE_REFERENCE.finditer(text):
+        if position < match.start():
+            parts.append(text[position:match.start()])
+        parts.append(FileReference(match.group(1), match.group(0)))
+        position = match.end()
+    if position < len(text):
+        parts.append(text[position:])
+    return parts
+
+
+def _parse(prompt: str) -> tuple[list, list]:
+    """Parse `prompt` in one left-to-right pass.
+
+    Returns the top-level part list and every Choice in closing-brace order.
+    Error messages and their positions match the legacy recursive expander: positions
+    are relative to the enclosing brace content, and errors are reported in the order
+    the recursive scan would have met them.
+    """
+    root = [[]]
+    current = root
+    stack = []  # (opening brace position, enclosing option list)
+    choices = []
+    literal_start = 0
+    empty_error = None  # (absolute position, message) of the first empty wildcard
+
+    for match in _SPECIAL_CHARS.finditer(prompt):
+        i = match.start()
+        char = prompt[i]
+        if char == "|":
+            # A top-level pipe is plain text; only brace content is split into options.
+            if not stack:
+                continue
+            if literal_start < i:
+                current[-1].extend(_literal_parts(prompt[literal_start:i]))
+            current.append([])
+        elif char == "{":
+            if literal_start < i:
+                current[-1].extend(_literal_parts(prompt[literal_start:i]))
+            stack.append((i, current))
+            current = [[]]
+        else:
+            if not stack:
+                if empty_error is not None:
+                    raise ValueError(empty_error[1])
+                raise ValueError(f"Unmatched closing brace at position {i}.")
+            start, parent = stack.pop()
+            if literal_start < i:
+                current[-1].extend(_literal_parts(prompt[literal_start:i]))
+            if i == start + 1 and empty_error is None:
+                offset = stack[-1][0] + 1 if stack else 0
+                empty_error = (start, f"Empty wildcard found at position {start - offset}.")
+            weights = _extract_weights(current)
+            if weights is not None and not any(weights) and empty_error is None:
+                offset = stack[-1][0] + 1 if stack else 0
+                raise ValueError(f"All options have zero weight in wildcard at position {start - offset}.")
+            choice = Choice(current, len(choices), weights)
+            choices.append(choice)
+            parent[-1].append(choice)
+            current = parent
+        literal_start = i + 1
+
+    if stack:
+        # The recursive scan stops at the first opening brace that never closes.
+        start = stack[0][0]
+        if empty_error is not None and empty_error[0] < start:
+            raise ValueError(empty_error[1])
+        raise ValueError(f"Unmatched opening brace at position {start}.")
+    if empty_error is not None:
+        raise ValueError(empty_error[1])
+    if literal_start < len(prompt):
+        current[-1].extend(_literal_parts(prompt[literal_start:]))
+    return root[0], choices
+
+
+class CompiledPrompt:
+    """A wildcard prompt parsed once into a choice tree that can be sampled per seed.
+
+    Expansion counts (for "unique" mode and enumeration) are computed once per wildcard
+    directory and kept until one of the referenced wildcard files changes.
+    """
+
+    __slots__ = ("parts", "choices", "file_names", "_counts")
+
+    def __init__(self, prompt: str):
+        # Without an opening brace only `__name__` tokens are recognised; stray braces
+        # and pipes stay literal, as they always have.
+        if "{" not in prompt:
+            self.parts = _literal_parts(prompt)
+            self.choices = []
+        else:
+            self.parts, self.choices = _parse(prompt)
+        part_lists = [self.parts] + [option for choice in self.choices for option in choice.options]
+        self.file_names = tuple(sorted({
+            part.name for parts in part_lists for part in parts if isinstance(part, FileReference)
+        }))
+        self._counts = {}  # wildcard_dir -> (file stamps, counts)
+
+    def expand(self, seed: int, mode: str = "legacy", wildcard_dir: str = DEFAULT_WILDCARD_DIR) -> str:
+        """Expand the prompt for `seed`.
+
+        In "legacy" mode choices are drawn exactly like the original expander, so old
+        seeds reproduce. In "lazy" mode each choice picks its option first and only
+        the picked option is expanded, so unpicked branches cost no draws and no work.
+        In "unique" mode the seed selects expansion `permute_index(seed % cardinality)`.
+        `__name__` tokens draw a line from `<wildcard_dir>/<name>.txt` as they are
+        rendered; tokens without a matching file are left as typed.
+        """
+        if mode == "unique":
+            counts = self._cached_counts(wildcard_dir)
+            total = counts[3]
+            return self._decode(permute_index(seed % total, total), counts, wildcard_dir)
+
+        rng = Random(seed)
+
+        def resolve(reference: FileReference) -> str:
+            lines = load_wildcard_file(wildcard_dir, reference.name)
+            if not lines:
+                return reference.token
+            return lines.line(rng.randint(0, len(lines) - 1))
+
+        if mode == "lazy":
+            return self._render(lambda choice: choice.draw(rng), resolve)
+        if mode != "legacy":
+            raise ValueError(f"Unknown expansion mode '{mode}'.")
+        # The legacy expander expanded every option before picking, so each choice drew
+        # its number right after all choices nested inside it: closing-brace order.
+        selected = [choice.draw(rng) for choice in self.choices]
+        return self._render(lambda choice: selected[choice.index], resolve)
+
+    def _cached_counts(self, wildcard_dir: str) -> tuple[list, list, dict, int]:
+        """`_option_counts(wildcard_dir)`, recomputed only when a referenced file changes.
+
+        The cache key is the `(mtime_ns, size)` of every referenced wildcard file, so a
+        prompt without `__name__` tokens is counted once and a prompt with them costs
+        one stat per file per call.
+        """
+        stamps = tuple(wildcard_file_stamp(wildcard_dir, name) for name in self.file_names)
+        cached = self._counts.get(wildcard_dir)
+        if cached is not None and cached[0] == stamps:
+            return cached[1]
+        counts = self._option_counts(wildcard_dir)
+        self._counts[wildcard_dir] = (stamps, counts)
+        return counts
+
+    def _option_counts(self, wildcard_dir: str) -> tuple[list, list, dict, int]:
+        """Count the expansions of the prompt and of every part of the choice tree.
+
+        Returns `(option_counts, choice_totals, file_counts, total)`: per choice index
+        the expansion count of each option and their sum, the number of usable lines
+        of each referenced file (1 if it is missing), and the count of the whole
+        prompt. Choices are stored in closing-brace order, so every choice nested in an
+        option has already been counted when the option itself is counted.
+        """
+        file_counts = {}
+
+        def part_count(part, choice_totals):
+            if isinstance(part, str):
+                return 1
+            if isinstance(part, FileReference):
+                if part.name not in file_counts:
+                    lines = load_wildcard_file(wildcard_dir, part.name)
+                    file_counts[part.name] = len(lines) if lines else 1
+                return file_counts[part.name]
+            return choice_totals[part.index]
+
+        option_counts = []
+        choice_totals = []
+        for choice in self.choices:
+            counts = []
+            for position, option in enumerate(choice.options):
+                # Options weighted zero can never be drawn, so they are not enumerated.
+                if choice.weights is not None and not choice.weights[position]:
+                    counts.append(0)
+                    continue
+                count = 1
+                for part in option:
+                    count *= part_count(part, choice_totals)
+                counts.append(count)
+            option_counts.append(counts)
+            choice_totals.append(sum(counts))
+        top_level = 1
+        for part in self.parts:
+            top_level *= part_count(part, choice_totals)
+        return option_counts, choice_totals, file_counts, top_level
+
+    def cardinality(self, wildcard_dir: str = DEFAULT_WILDCARD_DIR) -> int:
+        """Number of distinct choice paths (expansions) of the prompt."""
+        return self._cached_counts(wildcard_dir)[3]
+
+    def expansions(
+        self,
+        offset: int = 0,
+        limit: int | None = None,
+        order: str = "sequential",
+        key: int = 0,
+        wildcard_dir: str = DEFAULT_WILDCARD_DIR,
+    ):
+        """Yield expansions `offset .. offset + limit - 1` of the enumeration.
+
+        Index `i` is decoded as a mixed-radix number over the choice tree, so every
+        index in `0 .. cardinality() - 1` maps to a different choice path. With
+        `order="shuffled"` positions first go through `permute_index` under `key`,
+        which visits the same expansions in a pseudo-random order without repeats.
+        """
+        counts = self._cached_counts(wildcard_dir)
+        total = counts[3]
+        stop = total if limit is None else min(total, offset + limit)
+        for position in range(offset, stop):
+            index = permute_index(position, total, key) if order == "shuffled" else position
+            yield self._decode(index, counts, wildcard_dir)
+
+    def expand_index(self, index: int, wildcard_dir: str = DEFAULT_WILDCARD_DIR) -> str:
+        """Return expansion number `index` (0-based, modulo the cardinality)."""
+        counts = self._cached_counts(wildcard_dir)
+        return self._decode(index % counts[3], counts, wildcard_dir)
+
+    def _decode(self, index: int, counts, wildcard_dir: str) -> str:
+        """Render the expansion whose mixed-radix digits are `index`, without recursion.
+
+        Within a part list the first part is the least significant digit; within a
+        choice the options occupy consecutive index ranges.
+        """
+        option_counts, choice_totals, file_counts, _ = counts
+        pieces = []
+        stack = [[iter(self.parts), index]]
+        while stack:
+            frame = stack[-1]
+            for part in frame[0]:
+                if isinstance(part, str):
+                    pieces.append(part)
+                    continue
+                if isinstance(part, FileReference):
+                    frame[1], digit = divmod(frame[1], file_counts[part.name])
+                    lines = load_wildcard_file(wildcard_dir, part.name)
+                    pieces.append(lines.line(digit) if lines else part.token)
+                    continue
+                frame[1], digit = divmod(frame[1], choice_totals[part.index])
+                for option, count in zip(part.options, option_counts[part.index]):
+                    if digit < count:
+                        break
+                    digit -= count
+                stack.append([iter(option), digit])
+                break
+            else:
+                stack.pop()
+        return "".join(pieces)
+
+    def _render(self, select, resolve) -> str:
+        """Join the literal text along the options returned by `select(choice)`, without recursion."""
+        pieces = []
+        stack = [iter(self.parts)]
+        while stack:
+            for part in stack[-1]:
+                if isinstance(part, str):
+                    pieces.append(part)
+                elif isinstance(part, FileReference):
+                    pieces.append(resolve(part))
+                else:
+                    stack.append(iter(part.options[select(part)]))
+                    break
+            else:
+                stack.pop()
+        return "".join(pieces)
+
+
+def _feistel_round(value: int, key: int, round_index: int, bits: int) -> int:
+    state = mix64((key + (round_index + 1) * GOLDEN_GAMMA) & MASK64)
+    while True:
+        state = mix64(state ^ (value & MASK64))
+        value >>= 64
+        if not value:
+            break
+    result = state
+    width = 64
+    while width < bits:
+        state = mix64((state + GOLDEN_GAMMA) & MASK64)
+        result = (result << 64) | state
+        width += 64
+    return result & ((1 << bits) - 1)
+
+
+def permute_index(index: int, count: int, key: int = 0) -> int:
+    """Map `index` in `0 .. count - 1` to a unique index in the same range.
+
+    A four-round Feistel network over the smallest even bit width covering `count`,
+    with cycle walking to stay inside the range: a bijection for every `key`, with
+    O(1) memory and no table, so a seed range never yields the same index twice.
+    """
+    if count <= 1:
+        return 0
+    half_bits = ((count - 1).bit_length() + 1) // 2
+    half_mask = (1 << half_bits) - 1
+    value = index
+    while True:
+        left, right = value >> half_bits, value & half_mask
+        for round_index in range(4):
+            left, right = right, left ^ _feistel_round(right, key, round_index, half_bits)
+        value = (left << half_bits) | right
+        if value < count:
+            return value
+
+
+@lru_cache(maxsize=COMPILED_PROMPT_CACHE_SIZE)
+def compile_prompt(prompt: str) -> CompiledPrompt:
+    """Return the compiled form of `prompt`, reusing it across executions."""
+    return CompiledPrompt(prompt)
+
+
+def _expand_chunk(
+    prompt: str, first_seed: int, count: int, mode: str = "legacy", wildcard_dir: str = DEFAULT_WILDCARD_DIR
+) -> list[str]:
+    """Expand `count` consecutive seeds; module-level so process pool workers can pickle it."""
+    compiled = compile_prompt(prompt)
+    return [compiled.expand(seed, mode, wildcard_dir) for seed in range(first_seed, first_seed + count)]
+
+
+def expand_seed_range(
+    prompt: str,
+    start_seed: int,
+    count: int,
+    workers: int = 1,
+    mode: str = "legacy",
+    wildcard_dir: str = DEFAULT_WILDCARD_DIR,
+) -> list[str]:
+    """Expand `prompt` for seeds `start_seed .. start_seed + count - 1`, in seed order.
+
+    The prompt is parsed once. With `workers > 1` the range is split into contiguous
+    chunks expanded in a process pool; chunk results are concatenated in seed order,
+    so the output is identical to a serial run.
+    """
+    compile_prompt(prompt)  # surface parse errors before any worker is started
+    if workers <= 1 or count < 2 * workers:
+        return _expand_chunk(prompt, start_seed, count, mode, wildcard_dir)
+
+    chunk_size, remainder = divmod(count, workers)
+    starts, sizes = [], []
+    seed = start_seed
+    for worker in range(workers):
+        size = chunk_size + (1 if worker < remainder else 0)
+        starts.append(seed)
+        sizes.append(size)
+        seed += size
+
+    results = []
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = executor.map(
+                _expand_chunk, [prompt] * workers, starts, sizes, [mode] * workers, [wildcard_dir] * workers
+            )
+            for chunk in chunks:
+                results.extend(chunk)
+    except (BrokenProcessPool, OSError) as e:
+        print(f"Wildcard process pool unavailable ({e!r}); expanding serially.")
+        return _expand_chunk(prompt, start_seed, count, mode, wildcard_dir)
+    return results
@@ -0,0 +1,160 @@
+import mmap
+import os
+import re
+from array import array
+from functools import lru_cache
+
+try:
+    import folder_paths
+except ImportError:  # outside ComfyUI
+    folder_paths = None
+
+# Directory searched for `__name__` wildcard files when no other directory is given.
+_EXTENSION_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_WILDCARD_DIR = os.path.join(_EXTENSION_ROOT, "wildcards")
+
+# Number of loaded wildcard files kept in memory; entries are keyed by mtime and size,
+# so an edited file is simply loaded again under a new key.
+WILDCARD_FILE_CACHE_SIZE = 64
+
+# Files at least this large are indexed over a memory map instead of read into a list.
+MMAP_THRESHOLD_BYTES = 1 << 20
+
+# A line as text-mode `open()` splits them: a run of bytes between `\n`, `\r\n` or `\r`.
+_LINE_PATTERN = re.compile(rb"[^\r\n]+")
+
+
+def _usable(line: str) -> bool:
+    # The one definition of a usable line for both loaders: not blank, not a `#` comment.
+    return bool(line) and not line.startswith("#")
+
+
+class WildcardLines:
+    """The usable lines of a small wildcard file, held as a list."""
+
+    __slots__ = ("lines",)
+
+    def __init__(self, path: str):
+        with open(path, "r", encoding="utf-8") as f:
+            self.lines = [line for line in (line.strip() for line in f) if _usable(line)]
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def line(self, index: int) -> str:
+        return self.lines[index]
+
+
+class MappedWildcardLines:
+    """The usable lines of a large wildcard file, read on demand by offset.
+
+    The file is indexed once through a memory map that is closed again right away;
+    only the start and end offset of each line are kept, so memory stays at two
+    integers per line regardless of line length, and a picked line is read with one
+    seek. No handle or map stays open, so the file can be edited or replaced while
+    it is cached (the new mtime then loads a new entry). Lines are split and stripped
+    exactly like `WildcardLines` does, so a file gives the same lines (and the same
+    seeded picks) on either side of the size threshold.
+    """
+
+    __slots__ = ("_path", "_starts", "_ends")
+
+    def __init__(self, path: str):
+        self._path = path
+        self._starts = array("q")
+        self._ends = array("q")
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for match in _LINE_PATTERN.finditer(mapped):
+                if _usable(match.group().decode("utf-8").strip()):
+                    self._starts.append(match.start())
+                    self._ends.append(match.end())
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def line(self, index: int) -> str:
+        start = self._starts[index]
+        with open(self._path, "rb") as f:
+            f.seek(start)
+            return f.read(self._ends[index] - start).decode("utf-8").strip()
+
+
+@lru_cache(maxsize=WILDCARD_FILE_CACHE_SIZE)
+def _load(path: str, mtime_ns: int, size: int):
+    if size >= MMAP_THRESHOLD_BYTES:
+        return MappedWildcardLines(path)
+    return WildcardLines(path)
+
+
+def _wildcard_path(wildcard_dir: str, name: str):
+    # `<wildcard_dir>/<name>.txt`, or None if the name would leave `wildcard_dir`.
+    root = os.path.realpath(wildcard_dir)
+    path = os.path.realpath(os.path.join(root, name + ".txt"))
+    if os.path.commonpath([root, path]) != root:
+        return None
+    return path
+
+
+def _wildcard_roots() -> list:
+    # The extension's own folder, then any folders registered as "wildcards" in ComfyUI.
+    roots = [DEFAULT_WILDCARD_DIR]
+    if folder_paths is not None:
+        try:
+            roots.extend(folder_paths.get_folder_paths("wildcards"))
+        except KeyError:
+            pass
+    return roots
+
+
+def resolve_wildcard_dir(wildcard_dir: str = "") -> str:
+    """The directory to read wildcard files from, for a `wildcard_dir` node input.
+
+    Empty means the extension's `wildcards` folder. Anything else must be a relative
+    subfolder of a wildcard root (that folder, or a folder ComfyUI has registered
+    under "wildcards"); the first root holding it wins. Absolute paths and paths
+    leaving the roots raise ValueError, so the graph cannot point lookups at
+    arbitrary files on the server.
+    """
+    wildcard_dir = wildcard_dir.strip()
+    if not wildcard_dir:
+        return DEFAULT_WILDCARD_DIR
+    if os.path.isabs(wildcard_dir) or os.path.splitdrive(wildcard_dir)[0]:
+        raise ValueError(f"wildcard_dir must be a subfolder of the wildcards folder, not {wildcard_dir!r}")
+    candidates = []
+    for root in _wildcard_roots():
+        root = os.path.realpath(root)
+        path = os.path.realpath(os.path.join(root, wildcard_dir))
+        if os.path.commonpath([root, path]) != root:
+            raise ValueError(f"wildcard_dir {wildcard_dir!r} leaves the wildcards folder")
+        if os.path.isdir(path):
+            return path
+        candidates.append(path)
+    # Not created yet; tokens are left as typed until it is.
+    return candidates[0]
+
+
+def wildcard_file_stamp(wildcard_dir: str, name: str):
+    """`(mtime_ns, size)` of `<wildcard_dir>/<name>.txt`, or None if there is no such file."""
+    path = _wildcard_path(wildcard_dir, name)
+    if path is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_wildcard_file(wildcard_dir: str, name: str):
+    """Return the lines of `<wildcard_dir>/<name>.txt`, or None if there is no such file.
+
+    Names may contain `/` to reach subdirectories but cannot leave `wildcard_dir`.
+    """
+    path = _wildcard_path(wildcard_dir, name)
+    if path is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return _load(path, stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,112 @@
+"""Counter-based random numbers shared by the GR85 random nodes.
+
+Every value is a pure function of `(seed, stream, counter)`: the n-th output of a
+SplitMix64 sequence whose starting point is derived from the seed and a per-node
+stream number. There is no generator state to reseed or share, a single value costs
+a couple of multiplications, and any position of a stream can be read directly.
+"""
+
+MASK64 = 0xFFFFFFFFFFFFFFFF
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+_MIX1 = 0xBF58476D1CE4E5B9
+_MIX2 = 0x94D049BB133111EB
+_MIX1_INVERSE = pow(_MIX1, -1, 1 << 64)
+_MIX2_INVERSE = pow(_MIX2, -1, 1 << 64)
+
+# "legacy" keeps the Mersenne Twister results of earlier versions; "counter" uses this module.
+RNG_MODES = ("legacy", "counter")
+
+# One stream per node type, so equal seeds on different nodes give unrelated values.
+STREAM_RANDOM_INT = 1
+STREAM_RANDOM_FLOAT = 2
+STREAM_RANDOM_RATIO = 3
+STREAM_RANDOM_RATIO_SIZER = 4
+
+
+def mix64(value: int) -> int:
+    """SplitMix64 output function; a bijection on 64-bit integers."""
+    value = ((value ^ (value >> 30)) * _MIX1) & MASK64
+    value = ((value ^ (value >> 27)) * _MIX2) & MASK64
+    return value ^ (value >> 31)
+
+
+def _unshift_right(value: int, shift: int) -> int:
+    result = value
+    for _ in range(-(-64 // shift)):
+        result = value ^ (result >> shift)
+    return result
+
+
+def unmix64(value: int) -> int:
+    """Inverse of `mix64`."""
+    value = _unshift_right(value, 31)
+    value = (value * _MIX2_INVERSE) & MASK64
+    value = _unshift_right(value, 27)
+    value = (value * _MIX1_INVERSE) & MASK64
+    return _unshift_right(value, 30)
+
+
+def fold64(value: int) -> int:
+    """Fold an arbitrarily large non-negative seed into 64 bits."""
+    folded = value & MASK64
+    value >>= 64
+    while value:
+        folded = mix64(folded ^ (value & MASK64))
+        value >>= 64
+    return folded
+
+
+class CounterRNG:
+    """Stateless generator for one `(seed, stream)` pair.
+
+    Logical draw `n` reads the 64-bit words at positions `2n` and `2n + 1` of the
+    stream, so `randint(n, ...)` and `uniform(n, ...)` are O(1) for any `n`.
+    """
+
+    __slots__ = ("_key",)
+
+    def __init__(self, seed: int, stream: int = 0):
+        self._key = mix64(fold64(seed) ^ mix64(((stream + 1) * GOLDEN_GAMMA) & MASK64))
+
+    def u64(self, position: int) -> int:
+        """The 64-bit word at `position` of the stream."""
+        return mix64((self._key + (position + 1) * GOLDEN_GAMMA) & MASK64)
+
+    def random(self, counter: int = 0) -> float:
+        """Float in [0, 1) with 53 random bits."""
+        return (self.u64(2 * counter) >> 11) * (1.0 / (1 << 53))
+
+    def uniform(self, counter: int, a: float, b: float) -> float:
+        """Float between `a` and `b`, like `random.uniform`."""
+        return a + (b - a) * self.random(counter)
+
+    def randint(self, counter: int, a: int, b: int) -> int:
+        """Integer in [a, b], inclusive.
+
+        Uses 128 random bits and a multiply-shift, so the bias for any 64-bit range is
+        below 2**-64 without a rejection loop (which would break random access).
+        """
+        if b < a:
+            raise ValueError(f"empty range for randint ({a}, {b})")
+        bits = (self.u64(2 * counter) << 64) | self.u64(2 * counter + 1)
+        return a + ((bits * (b - a + 1)) >> 128)
+
+
+def successor_seed(seed: int, steps: int = 1) -> int:
+    """Seed `steps` links further down the counter-mode seed chain.
+
+    The chain walks SplitMix64 state space, `next = mix64(unmix64(seed) + gamma)`,
+    so jumping `k` links is a single multiply-add instead of `k` steps.
+    """
+    return mix64((unmix64(fold64(seed)) + steps * GOLDEN_GAMMA) & MASK64)
+
+
+def successor_seeds(seed: int, count: int) -> list:
+    """The first `count` successors of `seed` on the counter-mode seed chain."""
+    state = unmix64(fold64(seed))
+    seeds = []
+    for _ in range(count):
+        state = (state + GOLDEN_GAMMA) & MASK64
+        seeds.append(mix64(state))
+    return seeds
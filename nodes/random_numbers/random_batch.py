@@ -0,0 +1,111 @@
+import numpy as np
+from comfy_api.latest import io
+
+
+def _generator(seed: int) -> np.random.Generator:
+    # A dedicated PCG64 instance per execution: reproducible per seed, no global state.
+    return np.random.Generator(np.random.PCG64(seed))
+
+
+class RandomIntBatch(io.ComfyNode):
+    """Generates `count` seeded random integers in [min_value, max_value] as a list output."""
+
+    @classmethod
+    def define_schema(cls) -> io.Schema:
+        return io.Schema(
+            node_id="GR85_RandomIntBatch",
+            display_name="Random Int Batch",
+            category="GR85/Random/Numbers",
+            inputs=[
+                io.Int.Input(
+                    "seed",
+                    default=0,
+                    min=0,
+                ),
+                io.Int.Input(
+                    "count",
+                    default=16,
+                    min=1,
+                    max=100000,
+                ),
+                io.Int.Input(
+                    "min_value",
+                    default=0,
+                    min=-10000000000,
+                    max=10000000000,
+                ),
+                io.Int.Input(
+                    "max_value",
+                    default=100,
+                    min=-10000000000,
+                    max=10000000000,
+                ),
+            ],
+            outputs=[
+                io.Int.Output(is_output_list=True),
+            ],
+        )
+
+    @classmethod
+    def execute(cls, seed: int, count: int, min_value: int, max_value: int) -> io.NodeOutput:
+        values = _generator(seed).integers(min_value, max_value, size=count, endpoint=True)
+        return io.NodeOutput(values.tolist())
+
+
+class RandomFloatBatch(io.ComfyNode):
+    """Generates `count` seeded random floats in [min_value, max_value] as a list output."""
+
+    @classmethod
+    def define_schema(cls) -> io.Schema:
+        return io.Schema(
+            node_id="GR85_RandomFloatBatch",
+            display_name="Random Float Batch",
+            category="GR85/Random/Numbers",
+            inputs=[
+                io.Int.Input(
+                    "seed",
+                    default=0,
+                    min=0,
+                ),
+                io.Int.Input(
+                    "count",
+                    default=16,
+                    min=1,
+                    max=100000,
+                ),
+                io.Float.Input(
+                    "min_value",
+                    default=0.0,
+                    min=-1e10,
+                    max=1e10,
+                    step=0.0001,
+                ),
+                io.Float.Input(
+                    "max_value",
+                    default=1.0,
+                    min=-1e10,
+                    max=1e10,
+                    step=0.0001,
+                ),
+                io.Int.Input(
+                    "decimal_places",
+                    default=10,
+                    min=0,
+                ),
+            ],
+            outputs=[
+                io.Float.Output(is_output_list=True),
+            ],
+        )
+
+    @classmethod
+    def execute(
+        cls,
+        seed: int,
+        count: int,
+        min_value: float,
+        max_value: float,
+        decimal_places: int,
+    ) -> io.NodeOutput:
+        values = _generator(seed).uniform(min_value, max_value, size=count)
+        return io.NodeOutput(np.round(values, decimal_places).tolist())
@@ -1,6 +1,9 @@
 import random
 from comfy_api.latest import io
 
+from .counter_rng import STREAM_RANDOM_FLOAT, CounterRNG
+from .low_discrepancy import HALTON_BASES, SAMPLING_MODES, halton_uniform
+
 class RandomFloat(io.ComfyNode):
     """
     A ComfyUI node class that generates a random float based on given inputs.
@@ -21,6 +24,8 @@ class RandomFloat(io.ComfyNode):
                 "min_value": ("FLOAT", {"default": 0.0, "min": -1e-10, "max": 1e10, "step": 0.0001, "display": "number"}),
                 "max_value": ("FLOAT", {"default": 1.0, "min": -1e-10, "max": 1e10, "step": 0.0001, "display": "number"}),
                 "decimal_places": ("INT", {"default": 10, "min": 0, "display": "number"}),
+                "rng": (list(SAMPLING_MODES),),
+                "dimension": ("INT", {"default": 0, "min": 0, "max": len(HALTON_BASES) - 1, "display": "number"}),
             }
         }
 
@@ -61,6 +66,17 @@ class RandomFloat(io.ComfyNode):
                     default=10,
                     min=0,
                 ),
+                io.Combo.Input(
+                    "rng",
+                    options=list(SAMPLING_MODES),
+                    default="legacy",
+                ),
+                io.Int.Input(
+                    "dimension",
+                    default=0,
+                    min=0,
+                    max=len(HALTON_BASES) - 1,
+                ),
             ],
             outputs=[
                 io.Float.Output(),
@@ -74,6 +90,8 @@ class RandomFloat(io.ComfyNode):
         min_value: float,
         max_value: float,
         decimal_places: int,
+        rng: str = "legacy",
+        dimension: int = 0,
     ) -> io.NodeOutput:
         instance = cls()
         (value,) = instance.generate_random_float(
@@ -81,10 +99,20 @@ class RandomFloat(io.ComfyNode):
             min_value=min_value,
             max_value=max_value,
             decimal_places=decimal_places,
+            rng=rng,
+            dimension=dimension,
         )
         return io.NodeOutput(value)
 
-    def generate_random_float(self, seed: int, min_value: float, max_value: float, decimal_places: int) -> tuple:
+    def generate_random_float(
+        self,
+        seed: int,
+        min_value: float,
+        max_value: float,
+        decimal_places: int,
+        rng: str = "legacy",
+        dimension: int = 0,
+    ) -> tuple:
         """
         Generates a random float based on the given seed, min, max, and decimal places.
 
@@ -93,10 +121,19 @@ class RandomFloat(io.ComfyNode):
             min_value (float): The minimum value of the generated float.
             max_value (float): The maximum value of the generated float.
             decimal_places (int): The number of decimal places for the generated float.
+            rng (str): "legacy" (Mersenne Twister, reproduces earlier results), "counter", or
+                "halton" (the seed indexes a scrambled Halton sequence, for even sweeps).
+            dimension (int): Halton dimension; give each swept parameter its own.
 
         Returns:
             tuple: A tuple containing the generated random float.
         """
-        random.seed(seed)
-        random_float = round(random.uniform(min_value, max_value), decimal_places)
+        if rng == "counter":
+            value = CounterRNG(seed, STREAM_RANDOM_FLOAT).uniform(0, min_value, max_value)
+            return (round(value, decimal_places),)
+        if rng == "halton":
+            return (round(halton_uniform(seed, dimension, min_value, max_value), decimal_places),)
+        # A private generator per call: no interpreter-global state, so concurrent
+        # executions cannot interleave and other code's `random` state is untouched.
+        random_float = round(random.Random(seed).uniform(min_value, max_value), decimal_places)
         return (random_float,)
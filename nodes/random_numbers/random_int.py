@@ -1,6 +1,9 @@
 import random
 from comfy_api.latest import io
 
+from .counter_rng import STREAM_RANDOM_INT, CounterRNG
+from .low_discrepancy import HALTON_BASES, SAMPLING_MODES, halton_randint
+
 class RandomInt(io.ComfyNode):
     """
     A ComfyUI node class that generates a random integer based on given inputs.
@@ -20,6 +23,8 @@ class RandomInt(io.ComfyNode):
                 "seed": ("INT", {"default": 0, "min": 0, "display": "number"}),
                 "min_value": ("INT", {"default": 0, "min": -1e10, "max": 1e10, "display": "number"}),
                 "max_value": ("INT", {"default": 100, "min": -1e10, "max": 1e10, "display": "number"}),
+                "rng": (list(SAMPLING_MODES),),
+                "dimension": ("INT", {"default": 0, "min": 0, "max": len(HALTON_BASES) - 1, "display": "number"}),
             }
         }
 
@@ -53,6 +58,17 @@ class RandomInt(io.ComfyNode):
                     min=-10000000000,
                     max=10000000000,
                 ),
+                io.Combo.Input(
+                    "rng",
+                    options=list(SAMPLING_MODES),
+                    default="legacy",
+                ),
+                io.Int.Input(
+                    "dimension",
+                    default=0,
+                    min=0,
+                    max=len(HALTON_BASES) - 1,
+                ),
             ],
             outputs=[
                 io.Int.Output(),
@@ -65,16 +81,22 @@ class RandomInt(io.ComfyNode):
         seed: int,
         min_value: int,
         max_value: int,
+        rng: str = "legacy",
+        dimension: int = 0,
     ) -> io.NodeOutput:
         instance = cls()
         (value,) = instance.generate_random_int(
             seed=seed,
             min_value=min_value,
             max_value=max_value,
+            rng=rng,
+            dimension=dimension,
         )
         return io.NodeOutput(value)
 
-    def generate_random_int(self, seed: int, min_value: int, max_value: int) -> tuple:
+    def generate_random_int(
+        self, seed: int, min_value: int, max_value: int, rng: str = "legacy", dimension: int = 0
+    ) -> tuple:
         """
         Generates a random integer based on the given seed, min, and max values.
 
@@ -82,10 +104,18 @@ class RandomInt(io.ComfyNode):
             seed (int): The seed value for random number generation.
             min_value (int): The minimum value of the generated integer.
             max_value (int): The maximum value of the generated integer.
+            rng (str): "legacy" (Mersenne Twister, reproduces earlier results), "counter", or
+                "halton" (the seed indexes a scrambled Halton sequence, for even sweeps).
+            dimension (int): Halton dimension; give each swept parameter its own.
 
         Returns:
             tuple: A tuple containing the generated random integer.
         """
-        random.seed(seed)
-        random_int = random.randint(min_value, max_value)
+        if rng == "counter":
+            return (CounterRNG(seed, STREAM_RANDOM_INT).randint(0, min_value, max_value),)
+        if rng == "halton":
+            return (halton_randint(seed, dimension, min_value, max_value),)
+        # A private generator per call: no interpreter-global state, so concurrent
+        # executions cannot interleave and other code's `random` state is untouched.
+        random_int = random.Random(seed).randint(min_value, max_value)
         return (random_int,)
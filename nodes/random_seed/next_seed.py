@@ -1,6 +1,11 @@
 import random
 from comfy_api.latest import io
 
+from ..random_numbers.counter_rng import RNG_MODES, successor_seed, successor_seeds
+
+# The legacy chain can only be walked one link at a time; larger jumps need rng="counter".
+LEGACY_MAX_STEPS = 1_000_000
+
 
 class NextSeed(io.ComfyNode):
     def __init__(self):
@@ -11,6 +16,8 @@ class NextSeed(io.ComfyNode):
         return {
             "required": {
                 "seed": ("INT", {"forceInput": True, "default": 0, "min": 0, "max": 0xffffffffffffffff}),
+                "rng": (list(RNG_MODES),),
+                "steps": ("INT", {"default": 1, "min": 1, "max": 0xffffffffffffffff}),
             }
         }
 
@@ -32,6 +39,17 @@ class NextSeed(io.ComfyNode):
                     min=0,
                     max=0xFFFFFFFFFFFFFFFF,
                 ),
+                io.Combo.Input(
+                    "rng",
+                    options=list(RNG_MODES),
+                    default="legacy",
+                ),
+                io.Int.Input(
+                    "steps",
+                    default=1,
+                    min=1,
+                    max=0xFFFFFFFFFFFFFFFF,
+                ),
             ],
             outputs=[
                 io.Int.Output(),
@@ -42,13 +60,74 @@ class NextSeed(io.ComfyNode):
     def execute(
         cls,
         seed: int,
+        rng: str = "legacy",
+        steps: int = 1,
     ) -> io.NodeOutput:
         instance = cls()
-        (value,) = instance.next_seed(seed=seed)
+        (value,) = instance.next_seed(seed=seed, rng=rng, steps=steps)
         return io.NodeOutput(value)
 
-    def next_seed(self, seed):
-        random.seed(seed)
-        return (random.randint(0, 0xffffffffffffffff),)
+    def next_seed(self, seed, rng="legacy", steps=1):
+        """
+        Returns the seed `steps` links down the chain, i.e. `steps` chained NextSeed nodes.
+
+        The counter generator jumps there in O(1); the legacy generator has no jump-ahead
+        for reseeding chains, so it walks the chain (one step gives the original result).
+        """
+        if rng == "counter":
+            return (successor_seed(seed, steps),)
+        if steps > LEGACY_MAX_STEPS:
+            raise ValueError(f"The legacy generator walks the chain; use rng='counter' for more than {LEGACY_MAX_STEPS} steps.")
+        for _ in range(steps):
+            seed = _legacy_next_seed(seed)
+        return (seed,)
+
+
+class NextSeedSequence(io.ComfyNode):
+    @classmethod
+    def define_schema(cls) -> io.Schema:
+        return io.Schema(
+            node_id="GR85_NextSeedSequence",
+            display_name="Next Seed Sequence",
+            category="GR85/Random/Seed",
+            inputs=[
+                io.Int.Input(
+                    "seed",
+                    default=0,
+                    min=0,
+                    max=0xFFFFFFFFFFFFFFFF,
+                ),
+                io.Int.Input(
+                    "count",
+                    default=16,
+                    min=1,
+                    max=100000,
+                ),
+                io.Combo.Input(
+                    "rng",
+                    options=list(RNG_MODES),
+                    default="legacy",
+                ),
+            ],
+            outputs=[
+                io.Int.Output(is_output_list=True),
+            ],
+        )
+
+    @classmethod
+    def execute(cls, seed: int, count: int, rng: str = "legacy") -> io.NodeOutput:
+        """Output the first `count` successors of `seed` as a list, in chain order."""
+        if rng == "counter":
+            return io.NodeOutput(successor_seeds(seed, count))
+        seeds = []
+        for _ in range(count):
+            seed = _legacy_next_seed(seed)
+            seeds.append(seed)
+        return io.NodeOutput(seeds)
+
+
+def _legacy_next_seed(seed):
+    # A private generator per step leaves the interpreter-global `random` state alone.
+    return random.Random(seed).randint(0, 0xffffffffffffffff)
 
 
@@ -0,0 +1,163 @@
+"""Precomputed resolution buckets for snapping an aspect ratio to a pixel budget.
+
+A bucket is a `(width, height)` pair whose sides are multiples of the tolerance and
+whose area stays within the budget. Every attainable aspect ratio gets one entry:
+the largest bucket with exactly that aspect. The table is sorted by aspect and built
+once per `(budget, tolerance)`; a lookup is a bisect.
+"""
+import math
+from functools import lru_cache
+
+import numpy as np
+
+# Largest side a bucket may have (ComfyUI's maximum image resolution).
+MAX_BUCKET_SIDE = 16384
+
+# Upper bound on the (width, height) grid pairs examined while building one table:
+# about 6.8M at 1 MP with tolerance 1, 26k at 1 MP with tolerance 16.
+MAX_BUCKET_PAIRS = 16_000_000
+
+# Grid pairs processed per vectorized step while building a table.
+_BUILD_CHUNK_PAIRS = 1 << 20
+
+# Number of distinct (budget, tolerance) tables kept in memory (up to ~100 MB each at
+# tolerance 1, a few MB at the usual tolerances).
+BUCKET_TABLE_CACHE_SIZE = 8
+
+# Number of aspect ranges whose candidate index range is remembered.
+CANDIDATE_SPAN_CACHE_SIZE = 256
+
+# "round" rounds width and height independently (earlier behavior); "bucket" uses the table.
+SNAP_MODES = ("round", "bucket")
+
+
+class BucketTable:
+    """Budget-safe, tolerance-aligned resolutions sorted by aspect ratio.
+
+    `widths`, `heights` and `log_aspects` are NumPy arrays; `log_aspects[i]` is
+    `log(widths[i] / heights[i])`. Aspects are compared on a log scale so that 2:1 and
+    1:2 are equally far from 1:1.
+
+    In units of the tolerance a bucket is `m * (p, q)` with `p, q` coprime, so every
+    coprime pair with `p * q <= budget // tolerance**2` is one aspect, and its largest
+    bucket uses the largest `m` that keeps both the area and the sides in bounds.
+    """
+
+    __slots__ = ("budget", "tolerance", "widths", "heights", "log_aspects")
+
+    def __init__(self, budget: int, tolerance: int, max_side: int = MAX_BUCKET_SIDE):
+        self.budget = budget
+        self.tolerance = tolerance
+        max_units = max_side // tolerance
+        # Grid area limit; no pair can exceed max_units**2 anyway.
+        area_units = min(budget // (tolerance * tolerance), max_units * max_units)
+        if area_units < 1:
+            # The budget is below a single tolerance square; the smallest aligned size it is.
+            self.widths = np.array([tolerance], dtype=np.int64)
+            self.heights = np.array([tolerance], dtype=np.int64)
+            self.log_aspects = np.zeros(1)
+            return
+
+        columns = np.arange(1, min(max_units, area_units) + 1, dtype=np.int64)
+        rows_per_column = np.minimum(max_units, area_units // columns)
+        total = int(rows_per_column.sum())
+        if total > MAX_BUCKET_PAIRS:
+            raise ValueError(
+                f"{total} candidate buckets for {budget} pixels at tolerance {tolerance}; "
+                f"use a larger tolerance (the limit is {MAX_BUCKET_PAIRS})"
+            )
+
+        widths, heights = [], []
+        ends = np.cumsum(rows_per_column)
+        first = 0
+        while first < len(columns):
+            last = int(np.searchsorted(ends, ends[first] - rows_per_column[first] + _BUILD_CHUNK_PAIRS, "right"))
+            last = max(last, first + 1)
+            counts = rows_per_column[first:last]
+            p = np.repeat(columns[first:last], counts)
+            offsets = np.repeat(np.cumsum(counts) - counts, counts)
+            q = np.arange(len(p), dtype=np.int64) - offsets + 1
+            coprime = np.gcd(p, q) == 1
+            p, q = p[coprime], q[coprime]
+            limit = area_units // (p * q)
+            scale = np.floor(np.sqrt(limit)).astype(np.int64)
+            scale -= scale * scale > limit
+            scale += (scale + 1) * (scale + 1) <= limit
+            scale = np.minimum(scale, np.minimum(max_units // p, max_units // q))
+            widths.append(p * scale * tolerance)
+            heights.append(q * scale * tolerance)
+            first = last
+
+        widths = np.concatenate(widths)
+        heights = np.concatenate(heights)
+        order = np.argsort(widths / heights, kind="stable")
+        self.widths = widths[order]
+        self.heights = heights[order]
+        self.log_aspects = np.log(self.widths / self.heights)
+
+    def __len__(self) -> int:
+        return len(self.log_aspects)
+
+    def nearest_index(self, aspect: float) -> int:
+        """Index of the bucket whose aspect is closest to `aspect`; ties go to the larger area."""
+        return self._nearest_to_range(math.log(aspect), math.log(aspect))
+
+    def _nearest_to_range(self, low: float, high: float) -> int:
+        # Closest bucket below `low` or above `high` (both in log aspect).
+        position = int(np.searchsorted(self.log_aspects, low, "left"))
+        candidates = []
+        if position > 0:
+            candidates.append((low - self.log_aspects[position - 1], position - 1))
+        above = int(np.searchsorted(self.log_aspects, high, "left"))
+        if above < len(self.log_aspects):
+            candidates.append((self.log_aspects[above] - high, above))
+        return min(candidates, key=lambda c: (c[0], -int(self.widths[c[1]]) * int(self.heights[c[1]])))[1]
+
+    def nearest(self, aspect: float) -> tuple[int, int]:
+        """The `(width, height)` bucket closest to `aspect`."""
+        return self.bucket(self.nearest_index(aspect))
+
+    def bucket(self, index: int) -> tuple[int, int]:
+        """The `(width, height)` bucket at `index`, as Python ints."""
+        return int(self.widths[index]), int(self.heights[index])
+
+    def span(self, first_aspect: float, second_aspect: float) -> range:
+        """Indices of the buckets whose aspect lies between the two aspects, inclusive."""
+        low, high = sorted((math.log(first_aspect), math.log(second_aspect)))
+        # Widen by a rounding step so that exactly representable bounds are included.
+        epsilon = 1e-12
+        return range(
+            int(np.searchsorted(self.log_aspects, low - epsilon, "left")),
+            int(np.searchsorted(self.log_aspects, high + epsilon, "right")),
+        )
+
+    def nearest_to_span(self, first_aspect: float, second_aspect: float) -> int:
+        """Index of the bucket closest to the aspect range, for a range holding no bucket."""
+        low, high = sorted((math.log(first_aspect), math.log(second_aspect)))
+        return self._nearest_to_range(low, high)
+
+
+@lru_cache(maxsize=BUCKET_TABLE_CACHE_SIZE)
+def bucket_table(budget: int, tolerance: int) -> BucketTable:
+    """Return the bucket table for `budget` pixels at `tolerance`, built once per pair."""
+    return BucketTable(budget, tolerance)
+
+
+@lru_cache(maxsize=CANDIDATE_SPAN_CACHE_SIZE)
+def candidate_span(budget: int, tolerance: int, first_aspect: float, second_aspect: float) -> range:
+    """Indices into `bucket_table(budget, tolerance)` of the buckets between two aspects."""
+    return bucket_table(budget, tolerance).span(first_aspect, second_aspect)
+
+
+def oriented_aspect(width: float, height: float, orientation: str) -> float:
+    """`width / height`, flipped to be >= 1 for "landscape" or <= 1 for "portrait"."""
+    if orientation == "landscape":
+        return max(width, height) / min(width, height)
+    if orientation == "portrait":
+        return min(width, height) / max(width, height)
+    return width / height
+
+
+def snap_to_bucket(budget: int, tolerance: int, aspect: float) -> tuple[int, int]:
+    """Largest tolerance-aligned resolution within `budget` pixels closest to `aspect`."""
+    return bucket_table(budget, tolerance).nearest(aspect)
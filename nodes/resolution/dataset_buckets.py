@@ -0,0 +1,197 @@
+"""Assign every image of a dataset directory to a resolution bucket, headless.
+
+Run from the extension root:
+
+    python -m nodes.resolution.dataset_buckets <image dir> [--manifest buckets.jsonl]
+        [--pixel-amount 1048576] [--tolerance 64] [--orientation original]
+        [--snap-mode round] [--workers 32]
+
+Buckets use the same math as `ImageSizerAll.resize_dimensions_all` (or its
+`bucket` snap mode), applied to each image's own width and height. Sizes are read
+from file headers by a thread pool. Bucket assignment runs vectorized over NumPy
+arrays, a batch at a time. One JSON line per image is streamed to
+`<manifest>.partial`, which replaces the manifest when the run completes. A later
+run (or a resumed, interrupted one) reuses the recorded sizes of files whose mtime
+and size are unchanged, so it only reads headers of new or modified files.
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .bucket_index import SNAP_MODES, bucket_table
+from .image_probe import read_image_size
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp")
+
+# Images per batch: one thread-pool map, one vectorized assignment, one manifest write.
+BATCH_SIZE = 4096
+
+
+def assign_buckets(widths, heights, pixel_amount: int, tolerance: int, orientation: str = "original",
+                   snap_mode: str = "round") -> tuple[np.ndarray, np.ndarray]:
+    """Bucket width and height arrays for images of the given sizes.
+
+    With `snap_mode="round"` element `i` equals
+    `ImageSizerAll().resize_dimensions_all(pixel_amount, widths[i], heights[i], orientation, tolerance)`;
+    with `"bucket"` it is the closest-aspect entry of the `(pixel_amount, tolerance)` bucket table.
+    """
+    widths = np.asarray(widths, dtype=np.float64)
+    heights = np.asarray(heights, dtype=np.float64)
+    if snap_mode == "bucket":
+        return _nearest_buckets(widths, heights, pixel_amount, tolerance, orientation)
+
+    aspect_ratio = widths / heights
+    new_width = np.sqrt(float(pixel_amount) * aspect_ratio)
+    new_height = new_width / aspect_ratio
+    if orientation == "landscape":
+        new_width, new_height = np.maximum(new_width, new_height), np.minimum(new_width, new_height)
+    elif orientation == "portrait":
+        new_width, new_height = np.minimum(new_width, new_height), np.maximum(new_width, new_height)
+    # np.round rounds half to even, like the built-in round() used by the node.
+    final_width = np.round(np.round(new_width) / tolerance) * tolerance
+    final_height = np.round(np.round(new_height) / tolerance) * tolerance
+    return final_width.astype(np.int64), final_height.astype(np.int64)
+
+
+def _nearest_buckets(widths, heights, pixel_amount, tolerance, orientation):
+    # Vectorized `BucketTable.nearest_index`: bisect, then pick the closer neighbour.
+    table = bucket_table(pixel_amount, tolerance)
+    log_aspects = np.asarray(table.log_aspects)
+    table_widths = np.asarray(table.widths, dtype=np.int64)
+    table_heights = np.asarray(table.heights, dtype=np.int64)
+    areas = table_widths * table_heights
+
+    target = np.log(widths / heights)
+    if orientation == "landscape":
+        target = np.abs(target)
+    elif orientation == "portrait":
+        target = -np.abs(target)
+    position = np.searchsorted(log_aspects, target, side="left")
+    below = np.clip(position - 1, 0, len(log_aspects) - 1)
+    above = np.clip(position, 0, len(log_aspects) - 1)
+    distance_below = np.abs(log_aspects[below] - target)
+    distance_above = np.abs(log_aspects[above] - target)
+    take_above = (distance_above < distance_below) | (
+        (distance_above == distance_below) & (areas[above] > areas[below])
+    )
+    index = np.where(take_above, above, below)
+    return table_widths[index], table_heights[index]
+
+
+def scan_images(root: str, extensions=IMAGE_EXTENSIONS) -> list:
+    """Sorted paths, relative to `root` with `/` separators, of the images below `root`."""
+    found = []
+    for directory, subdirectories, files in os.walk(root):
+        subdirectories.sort()
+        for name in files:
+            if name.lower().endswith(extensions):
+                found.append(os.path.relpath(os.path.join(directory, name), root).replace(os.sep, "/"))
+    found.sort()
+    return found
+
+
+def load_manifest(path: str) -> dict:
+    """Records of a manifest by image path; a truncated last line (interrupted run) is ignored."""
+    records = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict) and "path" in record:
+                    records[record["path"]] = record
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def _probe(root: str, relative_path: str, previous: dict) -> dict:
+    path = os.path.join(root, relative_path)
+    try:
+        stat = os.stat(path)
+    except OSError as e:
+        return {"path": relative_path, "error": str(e)}
+    record = {"path": relative_path, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    known = previous.get(relative_path)
+    if known and known.get("mtime_ns") == stat.st_mtime_ns and known.get("size") == stat.st_size:
+        if "error" in known:
+            record["error"] = known["error"]
+        else:
+            record["width"], record["height"] = known["width"], known["height"]
+        return record
+    try:
+        record["width"], record["height"] = read_image_size(path)
+    except (OSError, ValueError) as e:
+        record["error"] = str(e)
+    return record
+
+
+def bucket_dataset(root: str, manifest_path: str, pixel_amount: int, tolerance: int,
+                   orientation: str = "original", snap_mode: str = "round", workers: int = 32,
+                   batch_size: int = BATCH_SIZE) -> dict:
+    """Write the bucket manifest for the images below `root`; returns counts for the run.
+
+    Sizes recorded in the existing manifest, or in the `.partial` file of an interrupted
+    run, are reused for unchanged files. Buckets are always recomputed, so changing
+    the bucket settings only costs the vectorized assignment.
+    """
+    partial_path = manifest_path + ".partial"
+    previous = load_manifest(manifest_path)
+    previous.update(load_manifest(partial_path))
+    paths = scan_images(root)
+    counts = {"images": len(paths), "probed": 0, "reused": 0, "errors": 0}
+
+    with ThreadPoolExecutor(max_workers=workers) as pool, \
+            open(partial_path, "w", encoding="utf-8") as out:
+        for start in range(0, len(paths), batch_size):
+            batch = list(pool.map(lambda p: _probe(root, p, previous), paths[start:start + batch_size]))
+            sized = [record for record in batch if "error" not in record]
+            if sized:
+                bucket_widths, bucket_heights = assign_buckets(
+                    [record["width"] for record in sized],
+                    [record["height"] for record in sized],
+                    pixel_amount, tolerance, orientation, snap_mode,
+                )
+                for record, bucket_width, bucket_height in zip(sized, bucket_widths.tolist(), bucket_heights.tolist()):
+                    record["bucket_width"], record["bucket_height"] = bucket_width, bucket_height
+            for record in batch:
+                known = previous.get(record["path"])
+                if "error" in record:
+                    counts["errors"] += 1
+                elif known and known.get("mtime_ns") == record["mtime_ns"] and known.get("size") == record["size"]:
+                    counts["reused"] += 1
+                else:
+                    counts["probed"] += 1
+                out.write(json.dumps(record) + "\n")
+            out.flush()
+    os.replace(partial_path, manifest_path)
+    return counts
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("root", help="directory scanned recursively for PNG, JPEG and WebP files")
+    parser.add_argument("--manifest", help="output JSONL (default: <root>/buckets.jsonl)")
+    parser.add_argument("--pixel-amount", type=int, default=1024 * 1024)
+    parser.add_argument("--tolerance", type=int, default=64)
+    parser.add_argument("--orientation", choices=("original", "landscape", "portrait"), default="original")
+    parser.add_argument("--snap-mode", choices=SNAP_MODES, default="round")
+    parser.add_argument("--workers", type=int, default=32, help="threads reading image headers")
+    args = parser.parse_args(argv)
+
+    manifest = args.manifest or os.path.join(args.root, "buckets.jsonl")
+    counts = bucket_dataset(args.root, manifest, args.pixel_amount, args.tolerance, args.orientation,
+                            args.snap_mode, args.workers)
+    print(f"{counts['images']} images: {counts['probed']} probed, {counts['reused']} reused, "
+          f"{counts['errors']} unreadable -> {manifest}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+import os
+
+from comfy_api.latest import io
+
+from .image_probe import read_image_size
+
+try:
+    import folder_paths
+except ImportError:  # outside ComfyUI
+    folder_paths = None
+
+
+def _resolve_image_path(image_path: str) -> str:
+    """Absolute paths are used as is; relative ones are looked up like LoadImage does."""
+    image_path = image_path.strip()
+    if os.path.isabs(image_path) or folder_paths is None:
+        return image_path
+    return folder_paths.get_annotated_filepath(image_path)
+
+
+class ImageDimensionProbe(io.ComfyNode):
+    """Outputs the width and height of an image file, read from its PNG, JPEG or WebP header.
+
+    No pixels are decoded, so this replaces a full image load whose only purpose is to
+    feed `original_width` / `original_height` of the resolution nodes.
+    """
+
+    @classmethod
+    def define_schema(cls) -> io.Schema:
+        return io.Schema(
+            node_id="GR85_ImageDimensionProbe",
+            display_name="Image Dimension Probe",
+            category="GR85/Resolution",
+            inputs=[
+                io.String.Input(
+                    "image_path",
+                    default="",
+                ),
+            ],
+            outputs=[
+                io.Int.Output(),
+                io.Int.Output(),
+            ],
+        )
+
+    @classmethod
+    def fingerprint_inputs(cls, image_path: str):
+        # Re-run when the file changes on disk, not only when the path does.
+        try:
+            stat = os.stat(_resolve_image_path(image_path))
+        except OSError:
+            return image_path
+        return image_path, stat.st_mtime_ns, stat.st_size
+
+    @classmethod
+    def execute(cls, image_path: str) -> io.NodeOutput:
+        width, height = read_image_size(_resolve_image_path(image_path))
+        return io.NodeOutput(width, height)
@@ -1,6 +1,8 @@
 import math
 from comfy_api.latest import io
 
+from .tensor_dimensions import connected_size
+
 
 class ImageDimensionResizer(io.ComfyNode):
     def __init__(self):
@@ -10,6 +12,9 @@ class ImageDimensionResizer(io.ComfyNode):
     def INPUT_TYPES(s):
         return {
             "required": {
+                "target_dimensions": (["512x512", "512x768", "768x768", "768x1024", "1024x1024", "1024x1280", "1280x1280", "1280x1536", "1536x1536", "1280x720", "1280x1080", "1920x1080", "1920x1440", "2560x1440"],),
+            },
+            "optional": {
                 "original_width": ("INT", {
                     "forceInput": True,
                     "default": 512,
@@ -26,7 +31,8 @@ class ImageDimensionResizer(io.ComfyNode):
                     "step": 1,
                     "display": "number"
                 }),
-                "target_dimensions": (["512x512", "512x768", "768x768", "768x1024", "1024x1024", "1024x1280", "1280x1280", "1280x1536", "1536x1536", "1280x720", "1280x1080", "1920x1080", "1920x1440", "2560x1440"],),
+                "image": ("IMAGE",),
+                "latent": ("LATENT",),
             }
         }
 
@@ -49,17 +55,27 @@ class ImageDimensionResizer(io.ComfyNode):
                     default=512,
                     min=1,
                     max=4096,
+                    optional=True,
                 ),
                 io.Int.Input(
                     "original_height",
                     default=512,
                     min=1,
                     max=4096,
+                    optional=True,
                 ),
                 io.String.Input(
                     "target_dimensions",
                     default="512x512",
                 ),
+                io.Image.Input(
+                    "image",
+                    optional=True,
+                ),
+                io.Latent.Input(
+                    "latent",
+                    optional=True,
+                ),
             ],
             outputs=[
                 io.Int.Output(),
@@ -70,19 +86,24 @@ class ImageDimensionResizer(io.ComfyNode):
     @classmethod
     def execute(
         cls,
-        original_width: int,
-        original_height: int,
-        target_dimensions: str,
+        original_width: int = 512,
+        original_height: int = 512,
+        target_dimensions: str = "512x512",
+        image=None,
+        latent: dict | None = None,
     ) -> io.NodeOutput:
         instance = cls()
         width, height = instance.resize_dimensions(
             original_width=original_width,
             original_height=original_height,
             target_dimensions=target_dimensions,
+            image=image,
+            latent=latent,
         )
         return io.NodeOutput(width, height)
 
-    def resize_dimensions(self, original_width, original_height, target_dimensions):
+    def resize_dimensions(self, original_width=512, original_height=512, target_dimensions="512x512", image=None,
+                          latent=None):
         """
         Calculates new dimensions while maintaining pixel count
         and maintaining the ratio of the original dimensions.
@@ -90,7 +111,11 @@ class ImageDimensionResizer(io.ComfyNode):
         first calculate the original ratio
         then calculate the target pixel count
         then calculate the new dimensions
+
+        A connected IMAGE (or else LATENT, scaled to pixels) replaces original_width and
+        original_height; only its shape is read.
         """
+        original_width, original_height = connected_size(image, latent) or (original_width, original_height)
         original_ratio = original_width / original_height
         target_width, target_height = map(int, target_dimensions.split("x"))
         target_pixels = target_width * target_height
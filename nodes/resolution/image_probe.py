@@ -0,0 +1,138 @@
+"""Read image dimensions from PNG, JPEG and WebP headers without decoding pixels.
+
+Only the header is read: the IHDR chunk of a PNG, the first chunk of a WebP, and
+the markers of a JPEG up to its start-of-frame (skipping other segments with a
+seek), so a probe costs a few hundred bytes of I/O. JPEG dimensions follow the EXIF
+orientation, matching the image ComfyUI's LoadImage produces.
+"""
+import os
+import struct
+from functools import lru_cache
+
+# Number of probed files remembered; entries are keyed by mtime and size, so an
+# edited file is simply probed again under a new key.
+IMAGE_PROBE_CACHE_SIZE = 65536
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# JPEG start-of-frame markers (SOF0-SOF15 except DHT, JPG and DAC).
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# Markers that stand alone, without a length field.
+_JPEG_STANDALONE_MARKERS = frozenset(range(0xD0, 0xD8)) | {0x01}
+
+# EXIF orientations that rotate the image by 90 degrees, swapping width and height.
+_TRANSPOSING_ORIENTATIONS = frozenset((5, 6, 7, 8))
+
+
+def _png_size(f) -> tuple[int, int]:
+    header = f.read(24)
+    if len(header) < 24 or header[12:16] not in (b"IHDR", b"CgBI"):
+        raise ValueError("PNG without an IHDR chunk")
+    if header[12:16] == b"CgBI":
+        # Apple's optimised PNG puts a CgBI chunk before IHDR.
+        f.seek(8 + 12 + struct.unpack(">I", header[8:12])[0])
+        header = f.read(16)
+        return struct.unpack(">II", header[8:16])
+    return struct.unpack(">II", header[16:24])
+
+
+def _webp_size(f) -> tuple[int, int]:
+    header = f.read(30)
+    chunk = header[12:16]
+    if len(header) < (25 if chunk == b"VP8L" else 30):
+        raise ValueError("truncated WebP header")
+    if chunk == b"VP8 ":
+        if header[23:26] != b"\x9d\x01\x2a":
+            raise ValueError("VP8 chunk without a key frame")
+        width, height = struct.unpack("<HH", header[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L":
+        if header[20] != 0x2F:
+            raise ValueError("VP8L chunk with a bad signature")
+        bits = int.from_bytes(header[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        return int.from_bytes(header[24:27], "little") + 1, int.from_bytes(header[27:30], "little") + 1
+    raise ValueError(f"unknown WebP chunk {chunk!r}")
+
+
+def _exif_orientation(segment: bytes) -> int:
+    """Orientation tag (0x0112) from the IFD0 of an APP1 Exif segment, 1 if absent."""
+    tiff = segment[6:]
+    if len(tiff) < 8 or tiff[:2] not in (b"II", b"MM"):
+        return 1
+    endian = "<" if tiff[:2] == b"II" else ">"
+    (offset,) = struct.unpack(endian + "I", tiff[4:8])
+    if offset + 2 > len(tiff):
+        return 1
+    (count,) = struct.unpack(endian + "H", tiff[offset:offset + 2])
+    for entry in range(offset + 2, min(offset + 2 + 12 * count, len(tiff) - 11), 12):
+        tag, kind, _, value = struct.unpack(endian + "HHIH", tiff[entry:entry + 10])
+        if tag == 0x0112 and kind == 3:
+            return value
+    return 1
+
+
+def _jpeg_size(f) -> tuple[int, int]:
+    f.seek(2)
+    orientation = 1
+    while True:
+        byte = f.read(1)
+        if not byte:
+            raise ValueError("JPEG without a start-of-frame marker")
+        if byte != b"\xff":
+            continue
+        marker = f.read(1)
+        while marker == b"\xff":
+            marker = f.read(1)
+        if not marker:
+            raise ValueError("JPEG without a start-of-frame marker")
+        marker = marker[0]
+        if marker in _JPEG_STANDALONE_MARKERS or marker == 0x00:
+            continue
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            raise ValueError("truncated JPEG segment")
+        (length,) = struct.unpack(">H", length_bytes)
+        if marker in _JPEG_SOF_MARKERS:
+            segment = f.read(5)
+            if len(segment) < 5:
+                raise ValueError("truncated JPEG start-of-frame")
+            height, width = struct.unpack(">HH", segment[1:5])
+            if orientation in _TRANSPOSING_ORIENTATIONS:
+                return height, width
+            return width, height
+        if marker == 0xE1:
+            segment = f.read(length - 2)
+            if segment.startswith(b"Exif\x00\x00"):
+                orientation = _exif_orientation(segment)
+        else:
+            f.seek(length - 2, os.SEEK_CUR)
+
+
+@lru_cache(maxsize=IMAGE_PROBE_CACHE_SIZE)
+def _probe(path: str, mtime_ns: int, size: int) -> tuple[int, int]:
+    with open(path, "rb") as f:
+        signature = f.read(12)
+        f.seek(0)
+        if signature.startswith(_PNG_SIGNATURE):
+            return _png_size(f)
+        if signature.startswith(b"\xff\xd8"):
+            return _jpeg_size(f)
+        if signature[:4] == b"RIFF" and signature[8:12] == b"WEBP":
+            return _webp_size(f)
+    raise ValueError("not a PNG, JPEG or WebP file")
+
+
+def read_image_size(path: str) -> tuple[int, int]:
+    """Return `(width, height)` of the image at `path`, read from its header.
+
+    Results are cached by path, mtime and size. Raises OSError if the file cannot be
+    read and ValueError if it is not a well-formed PNG, JPEG or WebP.
+    """
+    path = os.path.realpath(path)
+    stat = os.stat(path)
+    try:
+        return _probe(path, stat.st_mtime_ns, stat.st_size)
+    except (ValueError, struct.error) as e:
+        raise ValueError(f"Cannot read image size of {path}: {e}") from None
@@ -1,6 +1,9 @@
 import math
 from comfy_api.latest import io
 
+from .bucket_index import SNAP_MODES, oriented_aspect, snap_to_bucket
+from .tensor_dimensions import connected_size
+
 
 class ImageSizer(io.ComfyNode):
     def __init__(self):
@@ -33,6 +36,11 @@ class ImageSizer(io.ComfyNode):
                     "step": 1,
                     "display": "number"
                 }),
+            },
+            "optional": {
+                "snap_mode": (list(SNAP_MODES), {"default": "round"}),
+                "image": ("IMAGE",),
+                "latent": ("LATENT",),
             }
         }
 
@@ -76,6 +84,19 @@ class ImageSizer(io.ComfyNode):
                     min=1,
                     max=128,
                 ),
+                io.Combo.Input(
+                    "snap_mode",
+                    options=list(SNAP_MODES),
+                    default="round",
+                ),
+                io.Image.Input(
+                    "image",
+                    optional=True,
+                ),
+                io.Latent.Input(
+                    "latent",
+                    optional=True,
+                ),
             ],
             outputs=[
                 io.Int.Output(),
@@ -91,6 +112,9 @@ class ImageSizer(io.ComfyNode):
         height: int,
         orientation: str,
         tolerance: int,
+        snap_mode: str = "round",
+        image=None,
+        latent: dict | None = None,
     ) -> io.NodeOutput:
         instance = cls()
         new_width, new_height = instance.resize_dimensions(
@@ -99,15 +123,24 @@ class ImageSizer(io.ComfyNode):
             height=height,
             orientation=orientation,
             tolerance=tolerance,
+            snap_mode=snap_mode,
+            image=image,
+            latent=latent,
         )
         return io.NodeOutput(new_width, new_height)
 
-    def resize_dimensions(self, original_dimensions, width, height, orientation, tolerance):
-        source_width, source_height = map(int, original_dimensions.split("x"))
+    def resize_dimensions(self, original_dimensions, width, height, orientation, tolerance, snap_mode="round",
+                          image=None, latent=None):
+        # A connected IMAGE / LATENT supplies the original dimensions from its shape
+        source_width, source_height = connected_size(image, latent) or map(int, original_dimensions.split("x"))
 
         # Total pixels in the original image
         total_pixels = source_width * source_height
 
+        if snap_mode == "bucket":
+            # Closest-aspect bucket that stays within the original pixel count
+            return snap_to_bucket(total_pixels, tolerance, oriented_aspect(width, height, orientation))
+
         # Calculate new dimensions while maintaining the pixel count and aspect ratio
         new_height = math.sqrt(total_pixels * height / width)
         new_width = new_height * width / height
@@ -1,6 +1,9 @@
 import math
 from comfy_api.latest import io
 
+from .bucket_index import SNAP_MODES, oriented_aspect, snap_to_bucket
+from .tensor_dimensions import connected_size
+
 
 class ImageSizerAll(io.ComfyNode):
     def __init__(self):
@@ -39,6 +42,11 @@ class ImageSizerAll(io.ComfyNode):
                     "step": 1,
                     "display": "number"
                 }),
+            },
+            "optional": {
+                "snap_mode": (list(SNAP_MODES), {"default": "round"}),
+                "image": ("IMAGE",),
+                "latent": ("LATENT",),
             }
         }
 
@@ -84,6 +92,19 @@ class ImageSizerAll(io.ComfyNode):
                     min=1,
                     max=128,
                 ),
+                io.Combo.Input(
+                    "snap_mode",
+                    options=list(SNAP_MODES),
+                    default="round",
+                ),
+                io.Image.Input(
+                    "image",
+                    optional=True,
+                ),
+                io.Latent.Input(
+                    "latent",
+                    optional=True,
+                ),
             ],
             outputs=[
                 io.Int.Output(),
@@ -99,6 +120,9 @@ class ImageSizerAll(io.ComfyNode):
         height: int,
         orientation: str,
         tolerance: int,
+        snap_mode: str = "round",
+        image=None,
+        latent: dict | None = None,
     ) -> io.NodeOutput:
         instance = cls()
         new_width, new_height = instance.resize_dimensions_all(
@@ -107,10 +131,14 @@ class ImageSizerAll(io.ComfyNode):
             height=height,
             orientation=orientation,
             tolerance=tolerance,
+            snap_mode=snap_mode,
+            image=image,
+            latent=latent,
         )
         return io.NodeOutput(new_width, new_height)
 
-    def resize_dimensions_all(self, pixel_amount, width, height, orientation, tolerance):
+    def resize_dimensions_all(self, pixel_amount, width, height, orientation, tolerance, snap_mode="round",
+                              image=None, latent=None):
         """
         Calculates new dimensions for an image while maintaining the same pixel count
         and a specified aspect ratio, adjusted to the given tolerance.
@@ -121,10 +149,21 @@ class ImageSizerAll(io.ComfyNode):
             height (int): The second part of the desired aspect ratio.
             orientation (str): "original", "landscape", or "portrait".
             tolerance (int): The value to which width and height should be adjusted.
+            snap_mode (str): "round" rounds each side to the tolerance independently, which
+                can drift off the aspect ratio and exceed the pixel amount; "bucket" returns
+                the closest-aspect tolerance-aligned size within the pixel amount.
+            image: Optional IMAGE whose width and height replace `width` and `height`.
+            latent: Optional LATENT, used like `image` (its size scaled to pixels) when no
+                image is connected. Only the tensor shape is read.
 
         Returns:
             tuple: A tuple containing the new width and height of the image.
         """
+        width, height = connected_size(image, latent) or (width, height)
+
+        if snap_mode == "bucket":
+            return snap_to_bucket(pixel_amount, tolerance, oriented_aspect(width, height, orientation))
+
         # Calculate the aspect ratio based on width and height
         aspect_ratio = width / height
 
@@ -1,6 +1,9 @@
 import random
 from comfy_api.latest import io
 
+from ..random_numbers.counter_rng import STREAM_RANDOM_RATIO, CounterRNG
+from ..random_numbers.low_discrepancy import HALTON_BASES, SAMPLING_MODES, halton_uniform
+
 
 class RandomRatio(io.ComfyNode):
     def __init__(self):
@@ -40,6 +43,8 @@ class RandomRatio(io.ComfyNode):
                     "step": 1,
                     "display": "number"
                 }),
+                "rng": (list(SAMPLING_MODES),),
+                "dimension": ("INT", {"default": 0, "min": 0, "max": len(HALTON_BASES) - 1, "display": "number"}),
             }
         }
 
@@ -87,6 +92,17 @@ class RandomRatio(io.ComfyNode):
                     min=1,
                     max=4096,
                 ),
+                io.Combo.Input(
+                    "rng",
+                    options=list(SAMPLING_MODES),
+                    default="legacy",
+                ),
+                io.Int.Input(
+                    "dimension",
+                    default=0,
+                    min=0,
+                    max=len(HALTON_BASES) - 1,
+                ),
             ],
             outputs=[
                 io.Int.Output(),
@@ -102,6 +118,8 @@ class RandomRatio(io.ComfyNode):
         first_height: int,
         second_width: int,
         second_height: int,
+        rng: str = "legacy",
+        dimension: int = 0,
     ) -> io.NodeOutput:
         instance = cls()
         width, height = instance.random_ratio(
@@ -110,10 +128,13 @@ class RandomRatio(io.ComfyNode):
             first_height=first_height,
             second_width=second_width,
             second_height=second_height,
+            rng=rng,
+            dimension=dimension,
         )
         return io.NodeOutput(width, height)
 
-    def random_ratio(self, seed, first_width, first_height, second_width, second_height):
+    def random_ratio(self, seed, first_width, first_height, second_width, second_height, rng="legacy",
+                     dimension=0):
         """
         Calculates a random ratio between a min and max ratio.
 
@@ -123,16 +144,23 @@ class RandomRatio(io.ComfyNode):
           first_height: The minimum height for the ratio.
           second_width: The maximum width for the ratio.
           second_height: The maximum height for the ratio.
+          rng: "legacy" (Mersenne Twister, reproduces earlier results), "counter", or
+            "halton" (the seed indexes a scrambled Halton sequence, for even sweeps).
+          dimension: Halton dimension; give each swept parameter its own.
 
         Returns:
           A tuple containing the random width and height of the ratio.
         """
-        random.seed(seed)
-
         min_ratio = min(first_width / first_height, second_width / second_height)
         max_ratio = max(first_width / first_height, second_width / second_height)
 
-        random_ratio = random.uniform(min_ratio, max_ratio)
+        if rng == "counter":
+            random_ratio = CounterRNG(seed, STREAM_RANDOM_RATIO).uniform(0, min_ratio, max_ratio)
+        elif rng == "halton":
+            random_ratio = halton_uniform(seed, dimension, min_ratio, max_ratio)
+        else:
+            # A private generator leaves the interpreter-global `random` state alone.
+            random_ratio = random.Random(seed).uniform(min_ratio, max_ratio)
 
         # Converting the ratio to natural numbers for width and height
         if random_ratio >= 1:
@@ -0,0 +1,134 @@
+import random
+
+from comfy_api.latest import io
+
+from ..random_numbers.counter_rng import STREAM_RANDOM_RATIO_SIZER, CounterRNG
+from ..random_numbers.low_discrepancy import HALTON_BASES, SAMPLING_MODES, halton
+from .bucket_index import bucket_table, candidate_span
+
+# "aspect" draws an aspect uniformly between the two ratios (as RandomRatio does) and
+# takes the closest bucket; "bucket" draws uniformly among the buckets in that range.
+DISTRIBUTIONS = ("aspect", "bucket")
+
+
+def _unit_draw(seed: int, rng: str, dimension: int) -> float:
+    """One draw in [0, 1) from the selected generator."""
+    if rng == "counter":
+        return CounterRNG(seed, STREAM_RANDOM_RATIO_SIZER).random(0)
+    if rng == "halton":
+        return halton(seed, dimension)
+    return random.Random(seed).random()
+
+
+class RandomRatioSizer(io.ComfyNode):
+    """Samples a resolution whose aspect lies between two ratios, already snapped to a bucket.
+
+    Replaces RandomRatio -> ImageSizerAll: the sample is taken directly from the
+    tolerance-aligned resolutions within `pixel_amount` (see `bucket_index.py`), so
+    there is one execution and no double rounding. The candidate range is cached per
+    (pixel_amount, tolerance, ratios).
+    """
+
+    @classmethod
+    def define_schema(cls) -> io.Schema:
+        return io.Schema(
+            node_id="GR85_RandomRatioSizer",
+            display_name="Random Ratio Sizer",
+            category="GR85/Resolution",
+            inputs=[
+                io.Int.Input(
+                    "seed",
+                    default=0,
+                    min=0,
+                    max=0xFFFFFFFFFFFFFFFF,
+                ),
+                io.Int.Input(
+                    "first_width",
+                    default=1,
+                    min=1,
+                    max=4096,
+                ),
+                io.Int.Input(
+                    "first_height",
+                    default=1,
+                    min=1,
+                    max=4096,
+                ),
+                io.Int.Input(
+                    "second_width",
+                    default=1,
+                    min=1,
+                    max=4096,
+                ),
+                io.Int.Input(
+                    "second_height",
+                    default=1,
+                    min=1,
+                    max=4096,
+                ),
+                io.Int.Input(
+                    "pixel_amount",
+                    default=1024 * 1024,
+                    min=64,
+                    max=0xFFFFFFFFFFFFFFFF,
+                ),
+                io.Int.Input(
+                    "tolerance",
+                    default=16,
+                    min=1,
+                    max=128,
+                ),
+                io.Combo.Input(
+                    "distribution",
+                    options=list(DISTRIBUTIONS),
+                    default="aspect",
+                ),
+                io.Combo.Input(
+                    "rng",
+                    options=list(SAMPLING_MODES),
+                    default="legacy",
+                ),
+                io.Int.Input(
+                    "dimension",
+                    default=0,
+                    min=0,
+                    max=len(HALTON_BASES) - 1,
+                ),
+            ],
+            outputs=[
+                io.Int.Output(),
+                io.Int.Output(),
+            ],
+        )
+
+    @classmethod
+    def execute(
+        cls,
+        seed: int,
+        first_width: int,
+        first_height: int,
+        second_width: int,
+        second_height: int,
+        pixel_amount: int,
+        tolerance: int,
+        distribution: str = "aspect",
+        rng: str = "legacy",
+        dimension: int = 0,
+    ) -> io.NodeOutput:
+        first_ratio = first_width / first_height
+        second_ratio = second_width / second_height
+        table = bucket_table(pixel_amount, tolerance)
+        span = candidate_span(pixel_amount, tolerance, first_ratio, second_ratio)
+        draw = _unit_draw(seed, rng, dimension)
+
+        if not span:
+            # No bucket has an aspect inside the range; take the one closest to it.
+            index = table.nearest_to_span(first_ratio, second_ratio)
+        elif distribution == "bucket":
+            index = span[min(len(span) - 1, int(draw * len(span)))]
+        else:
+            low, high = sorted((first_ratio, second_ratio))
+            index = table.nearest_index(low + (high - low) * draw)
+            # The closest bucket may sit just outside the range; keep to the range.
+            index = min(max(index, span.start), span.stop - 1)
+        return io.NodeOutput(*table.bucket(index))
@@ -0,0 +1,28 @@
+"""Pixel dimensions of IMAGE and LATENT inputs, read from tensor shape metadata.
+
+Only `.shape` is read: no copy, clone, device transfer or synchronisation, so the
+tensor may live anywhere and stay untouched.
+"""
+
+# Pixels per latent cell along each side for the SD 1.x / SDXL / Flux VAEs.
+LATENT_SCALE_FACTOR = 8
+
+
+def image_size(image) -> tuple[int, int]:
+    """`(width, height)` of an IMAGE batch shaped `[batch, height, width, channels]`."""
+    return int(image.shape[-2]), int(image.shape[-3])
+
+
+def latent_size(latent: dict) -> tuple[int, int]:
+    """`(width, height)` in pixels of a LATENT whose samples end in `[..., height, width]`."""
+    samples = latent["samples"]
+    return int(samples.shape[-1]) * LATENT_SCALE_FACTOR, int(samples.shape[-2]) * LATENT_SCALE_FACTOR
+
+
+def connected_size(image=None, latent=None):
+    """Size of the connected IMAGE, else of the connected LATENT, else None."""
+    if image is not None:
+        return image_size(image)
+    if latent is not None:
+        return latent_size(latent)
+    return None